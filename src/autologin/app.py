@@ -2,18 +2,20 @@
 Automatically login into your Broker Accounts
 """
 
+import csv
+import functools
+import importlib
 import importlib.metadata
 import json
 import logging
 import os
-import pandas as pd
 import subprocess
 import sys
 import platform
 from PyQt5 import QtWidgets
 from PyQt5 import uic
 from PyQt5.QtWidgets import QFileDialog, QProgressDialog
-from PyQt5.QtCore import pyqtSignal, QTimer, Qt
+from PyQt5.QtCore import pyqtSignal, QTimer, Qt, QSortFilterProxyModel, QThread, QMetaObject, QEvent
 from PyQt5.QtWidgets import QMainWindow, QHeaderView, QMessageBox, QFileDialog
 from autologin.dialogs.add_angelone_dialog import AddAngelOneAccountDialog
 from autologin.dialogs.add_fivepaisa_dialog import AddFivePaisaAccountDialog
@@ -27,27 +29,12 @@ from autologin.dialogs.add_sharekhan_dialog import AddSharekhanAccountDialog
 from autologin.dialogs.add_jainam_lite_dialog import AddJainamLiteAccountDialog
 from autologin.dialogs.add_dhan_dialog import AddDhanAccountDialog
 from autologin.dialogs.add_firstock_dialog import AddFirstockAccountDialog
-from autologin.dialogs.how_to_add_angelone import HowToAddAngelOneDialog
-from autologin.dialogs.how_to_add_dhan import HowToAddDhanDialog
-from autologin.dialogs.how_to_add_motilal import HowToAddMotilalOswalDialog
-from autologin.dialogs.how_to_add_nuvama import HowToAddNuvamaDialog
-from autologin.dialogs.how_to_add_sharekhan import HowToAddSharekhanDialog
-from autologin.dialogs.how_to_add_zerodha import HowToAddZerodhaDialog
-from autologin.dialogs.how_to_add_upstox import HowToAddUpstoxDialog
-from autologin.dialogs.how_to_add_kotak import HowToAddKotakNeoDialog
-from autologin.dialogs.how_to_add_fivepaisa import HowToAddFivePaisaDialog
+from autologin.utils.accounts_store import AccountsStore
 from autologin.utils.alert_box import fail_box_alert, ok_box_alert
-from autologin.utils.table_model import pandasModel
-from autologin.utils.install_browser import ensure_browser_installed
-from autologin.utils.updater import (
-    get_current_version, check_for_updates, UpdateChecker
-)
-from autologin.dialogs.update_dialog import (
-    UpdateAvailableDialog, UpdateProgressDialog, NoUpdateDialog
-)
-from autologin.workers.executor_worker import ExecutorWorker
-from autologin.workers.playwright_driver import detect_optimal_concurrency
-from datetime import datetime
+from autologin.utils.table_model import AccountsModel
+from autologin.workers.accounts_writer import AccountsWriter
+from autologin.workers.refresh_worker import RefreshWorker
+from datetime import date, datetime
 from pathlib import Path
 from platformdirs import user_data_dir
 
@@ -58,41 +45,175 @@ def send_data_to_worker(worker_sender, data):
     worker_sender.emit(data)
 
 
+# Directory the app is installed in (contains ui/ and resources/)
+_INSTALL_DIR = Path(__file__).resolve().parent
+
+
+@functools.lru_cache(maxsize=1)
 def get_data_dir():
     return Path(user_data_dir(appname="AutoLogin")) / "data"
 
 
+# Internal broker key -> name shown in the table / CSV export
+_BROKER_DISPLAY = {
+    "angel_one": "Angel One",
+    "zerodha": "Zerodha",
+    "upstox": "Upstox",
+    "sharekhan": "Sharekhan",
+    "motilal": "Motilal Oswal",
+    "nuvama": "Nuvama",
+    "kotakneo": "KotakNeo",
+    "jainamlite": "Jainam Lite",
+    "fyers": "Fyers",
+    "fivepaisa": "5Paisa",
+    "dhan": "Dhan",
+    "firstock": "Firstock",
+    "pocketful": "Pocketful",
+}
+_BROKER_KEYS = {name: key for key, name in _BROKER_DISPLAY.items()}
+# Lower-cased display name -> broker key, for CSV import
+_BROKER_IMPORT_KEYS = {name.lower(): key for name, key in _BROKER_KEYS.items()}
+
+# Broker key -> (add/modify dialog, how-to dialog or None).
+# How-to dialogs are (module in autologin.dialogs, class name) and are only
+# imported the first time the user opens one.
+_BROKER_DIALOGS = {
+    "angel_one": (AddAngelOneAccountDialog, ("how_to_add_angelone", "HowToAddAngelOneDialog")),
+    "zerodha": (AddZerodhaAccountDialog, ("how_to_add_zerodha", "HowToAddZerodhaDialog")),
+    "upstox": (AddUpstoxAccountDialog, ("how_to_add_upstox", "HowToAddUpstoxDialog")),
+    "sharekhan": (AddSharekhanAccountDialog, ("how_to_add_sharekhan", "HowToAddSharekhanDialog")),
+    "nuvama": (AddNuvamaAccountDialog, ("how_to_add_nuvama", "HowToAddNuvamaDialog")),
+    "jainamlite": (AddJainamLiteAccountDialog, ("how_to_add_nuvama", "HowToAddNuvamaDialog")),
+    "kotakneo": (AddKotakNeoAccountDialog, ("how_to_add_kotak", "HowToAddKotakNeoDialog")),
+    "fivepaisa": (AddFivePaisaAccountDialog, ("how_to_add_fivepaisa", "HowToAddFivePaisaDialog")),
+    "fyers": (AddFyersAccountDialog, ("how_to_add_kotak", "HowToAddKotakNeoDialog")),
+    "motilal": (AddMotilalOswalAccountDialog, ("how_to_add_motilal", "HowToAddMotilalOswalDialog")),
+    "dhan": (AddDhanAccountDialog, ("how_to_add_dhan", "HowToAddDhanDialog")),
+    "firstock": (AddFirstockAccountDialog, ("how_to_add_dhan", "HowToAddDhanDialog")),
+    "pocketful": (AddPocketfulAccountDialog, None),
+}
+
+# Internal account field -> column header ("user_key" is intentionally not renamed)
+_COLUMN_DISPLAY = {
+    "broker": "Broker",
+    "client_id": "Client ID",
+    "mobile_number": "Mobile Number",
+    "password": "Password",
+    "mpin": "MPIN",
+    "totp_key": "TOTP Key",
+    "api_key": "API Key",
+    "api_secret": "API Secret",
+    "added_on": "Added On",
+    "last_login": "Last Login",
+    "status": "Status",
+}
+
+
+# Accepted CSV import headers for each internal account field
+_CSV_COLUMNS = {
+    "broker":       ["Broker", "broker"],
+    "client_id":    ["Client ID", "client_id", "client id", "clientid"],
+    "mobile_number":["Mobile Number", "mobile_number", "mobile"],
+    "password":     ["Password", "password"],
+    "mpin":         ["MPIN", "mpin"],
+    "totp_key":     ["TOTP Key", "totp_key", "totp"],
+    "api_key":      ["API Key", "api_key"],
+    "api_secret":   ["API Secret", "api_secret"],
+    "user_key":     ["User Key", "user_key"],
+    "added_on":     ["Added On", "added_on"],
+    "last_login":   ["Last Login", "last_login"],
+    "status":       ["Status", "status"],
+}
+_CSV_COLUMN_ALIASES = {alias: field for field, aliases in _CSV_COLUMNS.items() for alias in aliases}
+
+
+def _is_session_stale(account, now):
+    """True if a "Logged In" session is from a previous day (after 5 AM)."""
+    if account.get("status") != "Logged In":
+        return False
+    last_login_raw = account.get("last_login")
+    if not last_login_raw:
+        return False
+    try:
+        last_login = datetime.strptime(last_login_raw, "%Y-%m-%d %H:%M:%S")
+    except (TypeError, ValueError):
+        # Malformed last_login -> mark logged out to avoid crashes
+        return True
+    return last_login.date() != now.date() and last_login.hour >= 5
+
+
+def _display_row(broker, account):
+    """Build a table row dict keyed by display column names."""
+    row = {"Broker": _BROKER_DISPLAY.get(broker, broker)}
+    for key, value in account.items():
+        row[_COLUMN_DISPLAY.get(key, key)] = "" if value is None else value
+    return row
+
+
+def _display_rows(accounts, store):
+    """
+    Log out stale sessions in accounts, saving them through store at most
+    once, and return (rows, columns, number logged out) for display.
+    """
+    now = datetime.now()
+    stale = [a for lst in accounts.values() for a in lst if _is_session_stale(a, now)]
+    if stale:
+        for account in stale:
+            account["status"] = "Logged Out"
+            account["last_login"] = ""
+        # persist change once for all stale rows
+        try:
+            store.save(accounts)
+        except Exception as e:
+            logging.error(f"Failed to write accounts.json: {e}")
+
+    rows = [_display_row(broker, account) for broker, lst in accounts.items() for account in lst]
+    columns = list(dict.fromkeys(col for row in rows for col in row)) or ["Broker", "Client ID"]
+    return rows, columns, len(stale)
+
 
 class AutoLogin(QMainWindow):
     worker_data_sender = pyqtSignal(dict)
     show_update_dialog_signal = pyqtSignal(str, str, str) # new_version, download_url, release_notes
+    update_check_succeeded = pyqtSignal()
 
     def __init__(self):
         super().__init__()
-        current_directory = os.path.dirname(os.path.abspath(__file__))
-        uic.loadUi(os.path.join(current_directory, "ui", "main.ui"), self)
+        uic.loadUi(str(_INSTALL_DIR / "ui" / "main.ui"), self)
         self.setWindowTitle("Auto Login Platform")
         self.data_dir = get_data_dir()
         self.data_dir.mkdir(parents=True, exist_ok=True)
+        self.accounts_path = self.data_dir / "accounts.json"
+        # Writes are handed to _accounts_writer instead of blocking the GUI
+        self.store = AccountsStore(self.accounts_path, on_change=self.schedule_accounts_write)
         self.is_headless = False
 
+        # Periodic update check (every 60 minutes).
+        # Single-shot, re-armed after each successful silent check and
+        # paused while minimized
+        self._update_check_ok = False
+        self.update_timer = QTimer(self)
+        self.update_timer.setSingleShot(True)
+        self.update_timer.setInterval(60 * 60 * 1000)  # 60 minutes in milliseconds
+        self.update_timer.timeout.connect(self.check_for_updates_silent)
+
         self.showMaximized()
 
         self.statusbar_text.hide()
 
-        self.add_angelone_btn.clicked.connect(self.add_angel_one_account)
-        self.add_zerodha_btn.clicked.connect(self.add_zerodha_account)
-        self.add_upstox_btn.clicked.connect(self.add_upstox_account)
-        self.add_sharekhan_btn.clicked.connect(self.add_sharekhan_account)
-        self.add_motilaloswal_btn.clicked.connect(self.add_motilaloswal_account)
-        self.add_nuvama_btn.clicked.connect(self.add_nuvama_account)
-        self.add_jainamlite_btn.clicked.connect(self.add_jainam_lite_account)
-        self.add_kotakneo_btn.clicked.connect(self.add_kotakneo_account)
-        self.add_fivepaisa_btn.clicked.connect(self.add_fivepaisa_account)
-        self.add_fyers_btn.clicked.connect(self.add_fyers_account)
-        self.add_dhan_btn.clicked.connect(self.add_dhan_account)
-        self.add_firstock_btn.clicked.connect(self.add_firstock_account)
-        self.add_pocketful_btn.clicked.connect(self.add_pocketful_account)
+        self.add_angelone_btn.clicked.connect(lambda: self._add_account("angel_one"))
+        self.add_zerodha_btn.clicked.connect(lambda: self._add_account("zerodha"))
+        self.add_upstox_btn.clicked.connect(lambda: self._add_account("upstox"))
+        self.add_sharekhan_btn.clicked.connect(lambda: self._add_account("sharekhan"))
+        self.add_motilaloswal_btn.clicked.connect(lambda: self._add_account("motilal"))
+        self.add_nuvama_btn.clicked.connect(lambda: self._add_account("nuvama"))
+        self.add_jainamlite_btn.clicked.connect(lambda: self._add_account("jainamlite"))
+        self.add_kotakneo_btn.clicked.connect(lambda: self._add_account("kotakneo"))
+        self.add_fivepaisa_btn.clicked.connect(lambda: self._add_account("fivepaisa"))
+        self.add_fyers_btn.clicked.connect(lambda: self._add_account("fyers"))
+        self.add_dhan_btn.clicked.connect(lambda: self._add_account("dhan"))
+        self.add_firstock_btn.clicked.connect(lambda: self._add_account("firstock"))
+        self.add_pocketful_btn.clicked.connect(lambda: self._add_account("pocketful"))
         self.delete_acc_btn.clicked.connect(self.delete_selected_account)
         self.login_to_fail_btn.clicked.connect(self.login_to_failed_accounts)
         self.login_to_all_btn.clicked.connect(self.start_login_to_all_accounts)
@@ -108,13 +229,36 @@ class AutoLogin(QMainWindow):
         self.log_console = LogConsole(self)
         logging.info("Application starting... Log Console initialized.")
         
-        # Initialize with detected optimal concurrency
-        self.max_concurrent = detect_optimal_concurrency()
-        
-        # Ensure Playwright browser is installed (first-run)
-        self.ensure_browser_ready()
-        
-        self.refresh_accounts_in_table()
+        # One persistent model; refreshes swap its rows, the proxy sorts
+        self._table_model = AccountsModel()
+        self._table_proxy = QSortFilterProxyModel(self)
+        self._table_proxy.setSourceModel(self._table_model)
+        self.accounts_table.setModel(self._table_proxy)
+
+        # Table data is built on a worker thread with its own store instance
+        self._refresh_store = AccountsStore(self.accounts_path)
+        self._table_rows = None
+        self._table_rows_key = None
+        self._refresh_worker = RefreshWorker(self.build_table_rows)
+        self._refresh_thread = QThread(self)
+        self._refresh_worker.moveToThread(self._refresh_thread)
+        self._refresh_worker.ready.connect(self.on_table_rows_ready)
+        # The writer shares the refresh thread, so a queued write always
+        # lands before the table refresh queued after it
+        self._accounts_writer = AccountsWriter(self.store)
+        self._accounts_writer.moveToThread(self._refresh_thread)
+        self._accounts_writer.failed.connect(self.on_accounts_write_failed)
+        QtWidgets.QApplication.instance().aboutToQuit.connect(self.stop_refresh_thread)
+        self._refresh_thread.start()
+
+        # Add/modify and how-to dialogs are built once and reused
+        self._dialog_cache = {}
+        self._how_to_cache = {}
+        QtWidgets.QApplication.instance().aboutToQuit.connect(self.clear_dialog_cache)
+        # Write anything still pending and fold the journal back into
+        # accounts.json on the way out (after the refresh thread has stopped)
+        QtWidgets.QApplication.instance().aboutToQuit.connect(self.store.compact)
+
         self.table_functions()
         
         # Context Menu
@@ -123,35 +267,53 @@ class AutoLogin(QMainWindow):
 
         # Enable multi-selection for bulk actions
         self.accounts_table.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
-        self.load_user_preferences()
-        self.setup_menu_bar()
 
         # Connect update signal
         self.show_update_dialog_signal.connect(self._show_update_dialog)
-        
-        # Check for updates after UI is ready
+        # Emitted from the checker's thread, so delivered queued
+        self.update_check_succeeded.connect(self._on_update_check_succeeded)
 
+        # Let the window paint first; the rest of startup runs on the next tick
+        QTimer.singleShot(0, self._deferred_init)
+        
         # Check for updates after UI is ready
         QTimer.singleShot(2000, self.check_for_updates_silent)
-        
-        # Periodic update check (every 60 minutes)
-        self.update_timer = QTimer(self)
-        self.update_timer.timeout.connect(self.check_for_updates_silent)
-        self.update_timer.start(60 * 60 * 1000)  # 60 minutes in milliseconds
+
+    def _deferred_init(self):
+        """Startup work that doesn't need to block the first paint."""
+        self.load_user_preferences()
+        self.setup_menu_bar()
+        self.refresh_accounts_in_table()
+        # Ensure Playwright browser is installed (first-run)
+        self.ensure_browser_ready()
+
+    def changeEvent(self, event):
+        if event.type() == QEvent.WindowStateChange:
+            if self.isMinimized():
+                self.update_timer.stop()
+            elif event.oldState() & Qt.WindowMinimized:
+                # Resume the schedule paused above; maximize/restore-down
+                # toggles (including showMaximized() at startup) don't
+                self._rearm_update_timer()
+        super().changeEvent(event)
 
     def get_preferences_file(self):
         """Get the path to the preferences file"""
         return self.data_dir / "preferences.json"
 
+    def get_update_check_file(self):
+        """Get the path to the cached result of the last update check"""
+        return self.data_dir / ".update_check.json"
+
     def load_user_preferences(self):
         """Load user preferences from storage"""
         try:
             prefs_file = self.get_preferences_file()
             if prefs_file.exists():
-                with open(prefs_file, "r") as f:
-                    prefs = json.load(f)
-                    self.is_headless = prefs.get("background_login", False)
-                    self.update_background_button_text()
+                # Tiny file: one read + json.loads beats incremental json.load
+                prefs = json.loads(prefs_file.read_bytes())
+                self.is_headless = prefs.get("background_login", False)
+                self.update_background_button_text()
             else:
                 # Default preferences
                 self.is_headless = False
@@ -167,8 +329,8 @@ class AutoLogin(QMainWindow):
                 "background_login": self.is_headless
             }
             prefs_file = self.get_preferences_file()
-            with open(prefs_file, "w") as f:
-                json.dump(prefs, f, indent=2)
+            # Serialize first so the file gets a single compact write
+            prefs_file.write_text(json.dumps(prefs, separators=(",", ":")))
         except Exception as e:
             logging.error(f"Failed to save user preferences: {e}")
 
@@ -227,7 +389,7 @@ class AutoLogin(QMainWindow):
     def open_installation_directory(self):
         """Open the application installation directory in file browser"""
         try:
-            install_dir = os.path.dirname(os.path.abspath(__file__))
+            install_dir = _INSTALL_DIR
             self._open_directory(install_dir)
             self.statusBar().showMessage(f"Opened: {install_dir}", 3000)
         except Exception as e:
@@ -255,7 +417,7 @@ class AutoLogin(QMainWindow):
 
     def show_about_dialog(self):
         """Show about dialog with application information"""
-        install_dir = os.path.dirname(os.path.abspath(__file__))
+        install_dir = _INSTALL_DIR
         data_dir = str(self.data_dir)
 
         about_text = f"""
@@ -290,10 +452,10 @@ class AutoLogin(QMainWindow):
     def start_login_to_all_accounts(self):
         # Count accounts
         try:
-            with open(f"{self.data_dir}/accounts.json", "r") as f:
-                accounts = json.load(f)
-            total = sum(len(acc_list) for acc_list in accounts.values())
-        except:
+            total = sum(self.store.status_counts().values())
+        except (OSError, ValueError) as e:
+            # Unreadable or corrupt accounts.json
+            logging.warning(f"Could not read accounts.json: {e}", exc_info=e)
             total = 0
 
         if total == 0:
@@ -311,12 +473,18 @@ class AutoLogin(QMainWindow):
         if reply == QMessageBox.No:
             return
 
+        self.start_executor_worker()
+
+    def start_executor_worker(self, **kwargs):
+        """Start the login executor; imported here as it pulls in Playwright."""
+        from autologin.workers.executor_worker import ExecutorWorker
+
         self.on_login_started()
-        self.executor_worker = ExecutorWorker(self.data_dir, is_headless=self.is_headless)
+        self.executor_worker = ExecutorWorker(self.data_dir, is_headless=self.is_headless, **kwargs)
         self.executor_worker.status.connect(self.update_status)
-        self.executor_worker.finished.connect(self.on_login_finished) 
+        self.executor_worker.finished.connect(self.on_login_finished)
         self.executor_worker.start()
-    
+
     def on_login_started(self):
         for b in (self.login_to_all_btn, self.login_to_fail_btn, self.delete_acc_btn,
                   self.modify_acc_button, self.import_acc_button, self.export_acc_button,
@@ -347,6 +515,11 @@ class AutoLogin(QMainWindow):
         elif action == delete_action:
             self.delete_selected_account()
 
+    def get_row_data(self, index):
+        """Return the account row behind a (possibly sorted) table index."""
+        source_index = self._table_proxy.mapToSource(index)
+        return self._table_model.row(source_index.row())
+
     def get_selected_accounts_info(self):
         """Helper to get list of (broker, client_id) for selected rows"""
         selected_rows = self.accounts_table.selectionModel().selectedRows()
@@ -355,28 +528,12 @@ class AutoLogin(QMainWindow):
             
         accounts_to_process = []
         
-        reverse_broker_map = {
-            "Angel One": "angel_one",
-            "Zerodha": "zerodha",
-            "Upstox": "upstox",
-            "Sharekhan": "sharekhan",
-            "Motilal Oswal": "motilal",
-            "Nuvama": "nuvama",
-            "KotakNeo": "kotakneo",
-            "Jainam Lite": "jainamlite",
-            "Fyers": "fyers",
-            "5Paisa": "fivepaisa",
-            "Dhan": "dhan",
-            "Firstock": "firstock",
-            "Pocketful": "pocketful",
-        }
-        
         for index in selected_rows:
             # Use data directly from logic similar to delete/modify
             try:
-                account_data = self.accounts_table.model()._data.iloc[index.row()]
+                account_data = self.get_row_data(index)
                 display_broker = account_data['Broker']
-                broker = reverse_broker_map.get(display_broker, display_broker.lower().replace(" ", "_"))
+                broker = _BROKER_KEYS.get(display_broker, display_broker.lower().replace(" ", "_"))
                 client_id = account_data['Client ID']
                 accounts_to_process.append((broker, client_id))
             except Exception as e:
@@ -392,17 +549,8 @@ class AutoLogin(QMainWindow):
             fail_box_alert("Selection Error", "Please select at least one account to login.")
             return
 
-        self.on_login_started()
-        
         # Pass selected accounts to worker
-        self.executor_worker = ExecutorWorker(
-            self.data_dir, 
-            is_headless=self.is_headless,
-            selected_accounts=selected_accounts
-        )
-        self.executor_worker.status.connect(self.update_status)
-        self.executor_worker.finished.connect(self.on_login_finished) 
-        self.executor_worker.start()
+        self.start_executor_worker(selected_accounts=selected_accounts)
 
     def delete_selected_account(self):
         if self.accounts_table.currentIndex().row() == -1:
@@ -431,50 +579,26 @@ class AutoLogin(QMainWindow):
         if reply == QMessageBox.No:
             return
 
-        if len(selected_rows) >= 0:
-            for selected_row in selected_rows:
-                # Use data directly from the model to ensure sorted order is respected
-                account_data = self.accounts_table.model()._data.iloc[selected_row.row()]
-                
-                # Reverse map broker
-                reverse_broker_map = {
-                    "Angel One": "angel_one",
-                    "Zerodha": "zerodha",
-                    "Upstox": "upstox",
-                    "Sharekhan": "sharekhan",
-                    "Motilal Oswal": "motilal",
-                    "Nuvama": "nuvama",
-                    "KotakNeo": "kotakneo",
-                    "Jainam Lite": "jainamlite",
-                    "Fyers": "fyers",
-                    "5Paisa": "fivepaisa",
-                    "Dhan": "dhan",
-                    "Firstock": "firstock",
-                    "Pocketful": "pocketful",
-                }
-                display_broker = account_data['Broker']
-                broker = reverse_broker_map.get(display_broker, display_broker.lower().replace(" ", "_"))
-                
-                client_id = account_data['Client ID']
+        targets = set()
+        for selected_row in selected_rows:
+            account_data = self.get_row_data(selected_row)
+            display_broker = account_data['Broker']
+            broker = _BROKER_KEYS.get(display_broker, display_broker.lower().replace(" ", "_"))
+            targets.add((broker, account_data['Client ID']))
 
-                file_available = os.path.exists(f"{self.data_dir}/accounts.json")
-                if not file_available:
-                    with open(f"{self.data_dir}/accounts.json", "w") as f:
-                        json.dump({}, f)
-                        return
-                with open(f"{self.data_dir}/accounts.json", "r") as f:
-                    accounts = json.load(f)
-                if broker not in accounts:
-                    fail_box_alert("Error", "Broker not found")
-                    return
-                for account in accounts[broker]:
-                    if account['client_id'] == client_id:
-                        accounts[broker].remove(account)
-                        break
-                with open(f"{self.data_dir}/accounts.json", "w") as f:
-                    json.dump(accounts, f)
-            self.refresh_accounts_in_table()
-            ok_box_alert("Success", f"Successfully deleted {count} account(s)")
+        accounts = self.store.load()
+        affected_brokers = {broker for broker, _ in targets}
+        if not affected_brokers.issubset(accounts):
+            fail_box_alert("Error", "Broker not found")
+            return
+        for broker in affected_brokers:
+            accounts[broker] = [
+                a for a in accounts[broker] if (broker, a['client_id']) not in targets
+            ]
+        self.store.save(accounts)
+
+        self.refresh_accounts_in_table()
+        ok_box_alert("Success", f"Successfully deleted {count} account(s)")
 
     def clear_schedules(self):
         print("Clearing schedules...")
@@ -509,8 +633,10 @@ class AutoLogin(QMainWindow):
 
     def table_functions(self):
         self.accounts_table.horizontalHeader().setStretchLastSection(True)
-        self.accounts_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        # Interactive widths; sized to contents once on first population
+        self.accounts_table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
         self.accounts_table.setSortingEnabled(True)
+        self._columns_sized = False
 
     def import_acc_from_csv(self):
         # Pick file
@@ -523,113 +649,87 @@ class AutoLogin(QMainWindow):
         if not file_path:
             return
 
+        import pandas as pd
+
         # Read CSV
         try:
-            df = pd.read_csv(file_path, dtype=str).fillna("")
+            # Only parse known columns; empty cells arrive as "" (no NaN pass)
+            df = pd.read_csv(
+                file_path, dtype=str, engine="c",
+                keep_default_na=False, na_filter=False,
+                usecols=lambda c: c in _CSV_COLUMN_ALIASES,
+            )
         except Exception as e:
             fail_box_alert("Import Error", f"Could not read CSV:\n{e}")
             return
 
-        # Accept friendly or internal column names
-        colmap = {
-            "broker":       ["Broker", "broker"],
-            "client_id":    ["Client ID", "client_id", "client id", "clientid"],
-            "mobile_number":["Mobile Number", "mobile_number", "mobile"],
-            "password":     ["Password", "password"],
-            "mpin":         ["MPIN", "mpin"],
-            "totp_key":     ["TOTP Key", "totp_key", "totp"],
-            "api_key":      ["API Key", "api_key"],
-            "api_secret":   ["API Secret", "api_secret"],
-            "added_on":     ["Added On", "added_on"],
-            "last_login":   ["Last Login", "last_login"],
-            "status":       ["Status", "status"],
-        }
-        for target, candidates in colmap.items():
-            for c in candidates:
-                if c in df.columns:
-                    df.rename(columns={c: target}, inplace=True)
-                    break
+        # Accept friendly or internal column names; keep the first of any aliases
+        df.rename(columns=_CSV_COLUMN_ALIASES, inplace=True)
+        df = df.loc[:, ~df.columns.duplicated()]
 
         # Need at least broker + client_id
         if not {"broker", "client_id"}.issubset(df.columns):
             fail_box_alert("Import Error", "CSV must include ‘Broker’ and ‘Client ID’.")
             return
 
-        # Normalize broker names to internal keys
-        name_map = {
-            "angel one": "angel_one",
-            "zerodha": "zerodha",
-            "upstox": "upstox",
-            "sharekhan": "sharekhan",
-            "motilal oswal": "motilal",
-            "nuvama": "nuvama",
-            "kotakneo": "kotakneo",
-            "jainam lite": "jainamlite",
-            "fyers": "fyers",
-            "5paisa": "fivepaisa",
-            "fivepaisa": "fivepaisa",
-            "dhan": "dhan",
-            "firstock": "firstock",
-        }
-        def norm_broker(b: str) -> str:
-            s = str(b).strip()
-            key = s.lower()
-            return name_map.get(key, key.replace(" ", "_"))
-
-        df["broker"] = df["broker"].apply(norm_broker)
-
-        # Load existing JSON (or create)
-        path = self.data_dir / "accounts.json"
-        if path.exists():
-            with open(path, "r") as f:
-                accounts = json.load(f)
-        else:
-            accounts = {}
-
-        inserted = updated = skipped = 0
-        now_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-        # Upsert rows
-        for _, row in df.iterrows():
-            broker = row.get("broker", "").strip()
-            client_id = row.get("client_id", "").strip()
-            if not broker or not client_id:
-                skipped += 1
-                continue
-
-            rec = {
-                "client_id":     client_id,
-                "mobile_number": row.get("mobile_number", ""),
-                "password":      row.get("password", ""),
-                "mpin":          row.get("mpin", ""),
-                "totp_key":      row.get("totp_key", ""),
-                "api_key":       row.get("api_key", ""),
-                "user_key":      row.get("user_key", ""),
-                "api_secret":    row.get("api_secret", ""),
-                "added_on":      row.get("added_on", "") or now_str,
-                "last_login":    row.get("last_login", ""),
-                "status":        row.get("status", "") or "Logged Out",
+        # Normalize broker names and client ids column-wise
+        broker_key = df["broker"].str.strip().str.lower()
+        df["broker"] = broker_key.map(_BROKER_IMPORT_KEYS).fillna(broker_key.str.replace(" ", "_"))
+        df["client_id"] = df["client_id"].str.strip()
+
+        # Rows without broker + client_id cannot be imported
+        valid = (df["broker"] != "") & (df["client_id"] != "")
+        skipped = int((~valid).sum())
+        records = df[valid].to_dict("records")
+
+        # Load existing JSON (or create); written once when the batch exits
+        with self.store.batch() as accounts:
+            # {broker: {client_id: position}} so upserts don't scan the lists
+            index = {
+                b: {a.get("client_id"): i for i, a in enumerate(lst)}
+                for b, lst in accounts.items()
             }
 
-            accounts.setdefault(broker, [])
-            # find existing by client_id
-            idx = next((i for i, a in enumerate(accounts[broker]) if a.get("client_id") == client_id), None)
+            inserted = updated = 0
+            now_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+            # Upsert rows
+            for row in records:
+                broker = row["broker"]
+                client_id = row["client_id"]
+
+                rec = {
+                    "client_id":     client_id,
+                    "mobile_number": row.get("mobile_number", ""),
+                    "password":      row.get("password", ""),
+                    "mpin":          row.get("mpin", ""),
+                    "totp_key":      row.get("totp_key", ""),
+                    "api_key":       row.get("api_key", ""),
+                    "user_key":      row.get("user_key", ""),
+                    "api_secret":    row.get("api_secret", ""),
+                    "added_on":      row.get("added_on", "") or now_str,
+                    "last_login":    row.get("last_login", ""),
+                    "status":        row.get("status", "") or "Logged Out",
+                }
 
-            if idx is None:
-                accounts[broker].append(rec)
-                inserted += 1
-            else:
-                # preserve existing added_on if incoming empty
-                if not row.get("added_on") and accounts[broker][idx].get("added_on"):
-                    rec["added_on"] = accounts[broker][idx]["added_on"]
-                # merge (CSV values win if non-empty)
-                merged = {**accounts[broker][idx], **{k: v for k, v in rec.items() if v != ""}}
-                accounts[broker][idx] = merged
-                updated += 1
-
-        # Save + refresh UI
-        with open(path, "w") as f:
-            json.dump(accounts, f)
+                broker_accounts = accounts.setdefault(broker, [])
+                broker_index = index.setdefault(broker, {})
+                idx = broker_index.get(client_id)
+
+                if idx is None:
+                    broker_index[client_id] = len(broker_accounts)
+                    broker_accounts.append(rec)
+                    inserted += 1
+                else:
+                    # preserve existing added_on if incoming empty
+                    if not row.get("added_on") and broker_accounts[idx].get("added_on"):
+                        rec["added_on"] = broker_accounts[idx]["added_on"]
+                    # merge (CSV values win if non-empty)
+                    merged = {**broker_accounts[idx], **{k: v for k, v in rec.items() if v != ""}}
+                    broker_accounts[idx] = merged
+                    updated += 1
+
+            self.store.save(accounts)
 
         self.refresh_accounts_in_table()
         ok_box_alert("Import Complete",
@@ -639,97 +739,21 @@ class AutoLogin(QMainWindow):
                     f"Skipped: {skipped}")
 
     def export_all_to_csv(self):
-        # Ensure accounts variable is always defined
-        accounts = {}
-        json_path = f"{self.data_dir}/accounts.json"
-        if os.path.exists(json_path):
-            try:
-                with open(json_path, "r") as f:
-                    accounts = json.load(f) or {}
-            except Exception as e:
-                logging.error(f"Failed to read accounts.json for export: {e}")
-                accounts = {}
-
-        if not accounts:
-            # Nothing to export
-            self.accounts_df = pd.DataFrame(columns=["broker", "client_id"])
+        # Built from the store right now rather than the table, whose
+        # refresh may still be queued behind an import or edit
+        try:
+            accounts = self.store.load()
+        except Exception as e:
+            logging.error(f"Failed to read accounts.json for export: {e}")
+            fail_box_alert("Export Error", f"Could not read accounts:\n{e}")
+            return
+        rows, columns, logged_out = _display_rows(accounts, self.store)
+        if logged_out:
+            self.refresh_accounts_in_table()
+        if not rows:
+            ok_box_alert("Export", "There are no accounts to export.")
             return
 
-        data = []
-        for broker, account_list in accounts.items():
-            for account in account_list:
-                # Only attempt to parse last_login when present and status is Logged In
-                try:
-                    if account.get('status') == "Logged In":
-                        last_login_raw = account.get('last_login')
-                        if last_login_raw:
-                            try:
-                                last_login_dt = datetime.strptime(last_login_raw, "%Y-%m-%d %H:%M:%S")
-                                current_time = datetime.now()
-                                if last_login_dt.date() != current_time.date() and last_login_dt.hour >= 5:
-                                    account['status'] = "Logged Out"
-                                    account['last_login'] = ""
-                                    # persist change
-                                    try:
-                                        with open(json_path, "w") as f:
-                                            json.dump(accounts, f)
-                                    except Exception as e:
-                                        logging.error(f"Failed to write accounts.json while exporting: {e}")
-                            except Exception:
-                                # Malformed last_login -> mark logged out to avoid crashes
-                                account['status'] = "Logged Out"
-                                account['last_login'] = ""
-                                try:
-                                    with open(json_path, "w") as f:
-                                        json.dump(accounts, f)
-                                except Exception as e:
-                                    logging.error(f"Failed to write accounts.json while exporting: {e}")
-                except Exception as e:
-                    logging.error(f"Unexpected error while preparing export row: {e}")
-
-                data.append({
-                    "broker": broker,
-                    **account
-                })
-
-        df = pd.DataFrame(data)
-        if df.empty:
-            df = pd.DataFrame(columns=["broker", "client_id"])
-        self.accounts_df = df.copy()
-        df['broker'] = df['broker'].replace({
-            "angel_one": "Angel One",
-            "zerodha": "Zerodha",
-            "upstox": "Upstox",
-            "sharekhan": "Sharekhan",
-            "motilal" : "Motilal Oswal",
-            "nuvama" : "Nuvama",
-            "kotakneo" : "KotakNeo",
-            "jainamlite" : "Jainam Lite",
-            "fyers" : "Fyers",
-            "fivepaisa" : "5Paisa",
-            "dhan" : "Dhan",
-            "firstock" : "Firstock",
-            "pocketful" : "Pocketful",
-        })
-        df.rename(columns={
-            "broker": "Broker",
-            "client_id": "Client ID",
-            "mobile_number": "Mobile Number",
-            "password": "Password",
-            "mpin": "MPIN",
-            "totp_key": "TOTP Key",
-            "api_key": "API Key",
-            "api_secret": "API Secret",
-            "added_on": "Added On",
-            # "user_key" : "User Key",
-            "last_login": "Last Login",
-            "status": "Status"
-        }, inplace=True)
-        df = df.fillna("")
-        downloads_path = str(Path.home() / "Documents" / "AutoLogin")
-        os.makedirs(downloads_path, exist_ok=True)
-        csv_file_path = os.path.join(downloads_path, "accounts_export.csv")
-        df.to_csv(csv_file_path, index=False)
         options = QFileDialog.Options()
         options |= QFileDialog.DontUseNativeDialog
         file_path, _ = QFileDialog.getSaveFileName(
@@ -740,7 +764,15 @@ class AutoLogin(QMainWindow):
             options=options
         )
         if file_path:
-            df.to_csv(file_path, index=False)
+            try:
+                with open(file_path, "w", newline="", encoding="utf-8") as f:
+                    writer = csv.DictWriter(f, fieldnames=columns, restval="", extrasaction="ignore")
+                    writer.writeheader()
+                    writer.writerows(rows)
+            except OSError as e:
+                logging.error(f"Failed to export accounts: {e}")
+                fail_box_alert("Export Error", f"Could not save the CSV file:\n{e}")
+                return
             msg = QMessageBox()
             msg.setIcon(QMessageBox.Information)
             msg.setWindowTitle("Export Complete")
@@ -749,240 +781,104 @@ class AutoLogin(QMainWindow):
             msg.setStandardButtons(QMessageBox.Ok)
             msg.exec_()
 
+    def build_table_rows(self):
+        """Build (rows, columns) for the table. Runs on the refresh thread."""
+        # Staleness depends on the date, so the cache is keyed on it too
+        key = (self._refresh_store.stat_key(), date.today())
+        if key[0] is not None and key == self._table_rows_key:
+            return self._table_rows
+
+        accounts = self._refresh_store.load()
+        rows, columns, _ = _display_rows(accounts, self._refresh_store)
+        self._table_rows = (rows, columns)
+        # Re-stat: logging out stale sessions may have rewritten the file
+        self._table_rows_key = (self._refresh_store.stat_key(), key[1])
+        return self._table_rows
+
+    def schedule_accounts_write(self):
+        QMetaObject.invokeMethod(self._accounts_writer, "flush", Qt.QueuedConnection)
+
+    def on_accounts_write_failed(self, error):
+        fail_box_alert("Save Error", f"Could not save accounts:\n{error}")
+
     def refresh_accounts_in_table(self):
-        accounts = {}
-        file_available = os.path.exists(f"{self.data_dir}/accounts.json")
-        if not file_available:
-            self.accounts_df = pd.DataFrame(columns=["broker", "client_id"])
-            with open(f"{self.data_dir}/accounts.json", "w") as f:
-                json.dump({}, f)
+        QMetaObject.invokeMethod(self._refresh_worker, "run", Qt.QueuedConnection)
+
+    def on_table_rows_ready(self, rows, columns):
+        if rows is self._table_model.rows():
+            # Nothing changed on disk; keep the current view as is
+            return
+        if self._table_model.update_rows(rows, columns):
+            # Same rows and columns, only values changed: the proxy
+            # re-sorts just the rows it's told about
+            return
+        # Sort once after the swap instead of while the model resets
+        self.accounts_table.setSortingEnabled(False)
+        self._table_model.set_rows(rows, columns)
+        if not self._columns_sized and rows:
+            self.accounts_table.resizeColumnsToContents()
+            self._columns_sized = True
+        self.accounts_table.setSortingEnabled(True)
+
+    def stop_refresh_thread(self):
+        self._refresh_thread.quit()
+        self._refresh_thread.wait()
+
+    def _account_dialog(self, broker):
+        """Return the broker's add/modify dialog, creating it on first use."""
+        dialog = self._dialog_cache.get(broker)
+        if dialog is None:
+            dialog_cls, how_to = _BROKER_DIALOGS[broker]
+            if how_to is None:
+                dialog = dialog_cls()
+            else:
+                dialog = dialog_cls(lambda: self.show_how_to_dialog(how_to))
+            self._dialog_cache[broker] = dialog
+        return dialog
+
+    def show_how_to_dialog(self, how_to):
+        """Show a how-to dialog from the first step, reusing an earlier instance."""
+        dialog = self._how_to_cache.get(how_to)
+        if dialog is None:
+            module_name, class_name = how_to
+            module = importlib.import_module(f"autologin.dialogs.{module_name}")
+            dialog = self._how_to_cache[how_to] = getattr(module, class_name)()
         else:
-            with open(f"{self.data_dir}/accounts.json", "r") as f:
-                accounts = json.load(f)
-            if not accounts:
-                self.accounts_df = pd.DataFrame(columns=["broker", "client_id"])
-                return
-        data = []
-        for broker, account_list in accounts.items():
-            for account in account_list:
-                if account['status'] == "Logged In":
-                    last_login = datetime.strptime(account['last_login'], "%Y-%m-%d %H:%M:%S")
-                    current_time = datetime.now()
-                    if last_login.date() != current_time.date() and last_login.hour >= 5:
-                        account['status'] = "Logged Out"
-                        account['last_login'] = ""
-                        with open(f"{self.data_dir}/accounts.json", "w") as f:
-                            json.dump(accounts, f)
-
-                data.append({
-                    "broker": broker,
-                    **account
-                })
-        df = pd.DataFrame(data)
-        if df.empty:
-            df = pd.DataFrame(columns=["broker", "client_id"])
-        self.accounts_df = df.copy()
-        df['broker'] = df['broker'].replace({
-            "angel_one": "Angel One",
-            "zerodha": "Zerodha",
-            "upstox": "Upstox",
-            "sharekhan": "Sharekhan",
-            "motilal" : "Motilal Oswal",
-            "nuvama" : "Nuvama",
-            "kotakneo" : "KotakNeo",
-            "jainamlite" : "Jainam Lite",
-            "fyers" : "Fyers",
-            "fivepaisa" : "5Paisa",
-            "dhan" : "Dhan",
-            "firstock" : "Firstock",
-            "pocketful" : "Pocketful",
-        })
-        df.rename(columns={
-            "broker": "Broker",
-            "client_id": "Client ID",
-            "mobile_number": "Mobile Number",
-            "password": "Password",
-            "mpin": "MPIN",
-            "totp_key": "TOTP Key",
-            "api_key": "API Key",
-            # "user_key": "User Key",
-            "api_secret": "API Secret",
-            "added_on": "Added On",
-            "last_login": "Last Login",
-            "status": "Status"
-        }, inplace=True)
-        df = df.fillna("")
-        # df = df.drop("User Key", axis=1)
-        self.accounts_table.setModel(pandasModel(df, editable=False))
-
-    def add_angel_one_account(self):
-        def show_how_to_dialog():
-            self.how_to_dialog = HowToAddAngelOneDialog() 
-            self.how_to_dialog.show()
-
-        angel_one_account_dialog = AddAngelOneAccountDialog(show_how_to_dialog)
-        angel_one_account_dialog.show()
-        if angel_one_account_dialog.exec_():
-            payload = angel_one_account_dialog.get_inputs()
-            self.add_to_account_list("angel_one", payload)
-
-    def add_zerodha_account(self):
-        def show_how_to_dialog():
-            self.how_to_dialog = HowToAddZerodhaDialog() 
-            self.how_to_dialog.show()
-
-        zerodha_account_dialog = AddZerodhaAccountDialog(show_how_to_dialog)
-        zerodha_account_dialog.show()
-        if zerodha_account_dialog.exec_():
-            payload = zerodha_account_dialog.get_inputs()
-            self.add_to_account_list("zerodha", payload)
-
-    def add_upstox_account(self):
-        def show_how_to_dialog():
-            self.how_to_dialog = HowToAddUpstoxDialog() 
-            self.how_to_dialog.show()
-        
-        upstox_account_dialog = AddUpstoxAccountDialog(show_how_to_dialog)
-        upstox_account_dialog.show()
-        if upstox_account_dialog.exec_():
-            payload = upstox_account_dialog.get_inputs()
-            self.add_to_account_list("upstox", payload)
-
-    def add_sharekhan_account(self):
-        def show_how_to_dialog():
-            self.how_to_dialog = HowToAddSharekhanDialog() 
-            self.how_to_dialog.show()
-
-        sharekhan_account_dialog = AddSharekhanAccountDialog(show_how_to_dialog)
-        sharekhan_account_dialog.show()
-        if sharekhan_account_dialog.exec_():
-            payload = sharekhan_account_dialog.get_inputs()
-            self.add_to_account_list("sharekhan", payload)
-
-    def add_nuvama_account(self):
-        def show_how_to_dialog():
-            self.how_to_dialog = HowToAddNuvamaDialog()
-            self.how_to_dialog.show()
-
-        nuvama_account_dialog = AddNuvamaAccountDialog(show_how_to_dialog)
-        nuvama_account_dialog.show()
-        if nuvama_account_dialog.exec_():
-            payload = nuvama_account_dialog.get_inputs()
-            self.add_to_account_list("nuvama", payload)
-    
-    def add_jainam_lite_account(self):
-        def show_how_to_dialog():
-            self.how_to_dialog = HowToAddNuvamaDialog()
-            self.how_to_dialog.show()
-
-        jainamlite_account_dialog = AddJainamLiteAccountDialog(show_how_to_dialog)
-        jainamlite_account_dialog.show()
-        if jainamlite_account_dialog.exec_():
-            payload = jainamlite_account_dialog.get_inputs()
-            self.add_to_account_list("jainamlite", payload)
-
-    def add_kotakneo_account(self):
-        def show_how_to_dialog():
-            self.how_to_dialog = HowToAddKotakNeoDialog()
-            self.how_to_dialog.show()
-
-        kotakneo_account_dialog = AddKotakNeoAccountDialog(show_how_to_dialog)
-        kotakneo_account_dialog.show()
-        if kotakneo_account_dialog.exec_():
-            payload = kotakneo_account_dialog.get_inputs()
-            self.add_to_account_list("kotakneo", payload)
-
-    def add_fivepaisa_account(self):
-        def show_how_to_dialog():
-            self.how_to_dialog = HowToAddFivePaisaDialog()
-            self.how_to_dialog.show()
-
-        fivepaisa_account_dialog = AddFivePaisaAccountDialog(show_how_to_dialog)
-        fivepaisa_account_dialog.show()
-        if fivepaisa_account_dialog.exec_():
-            payload = fivepaisa_account_dialog.get_inputs()
-            self.add_to_account_list("fivepaisa", payload)
-
-    def add_fyers_account(self):
-        def show_how_to_dialog():
-            self.how_to_dialog = HowToAddKotakNeoDialog()
-            self.how_to_dialog.show()
-
-        fyers_account_dialog = AddFyersAccountDialog(show_how_to_dialog)
-        fyers_account_dialog.show()
-        if fyers_account_dialog.exec_():
-            payload = fyers_account_dialog.get_inputs()
-            self.add_to_account_list("fyers", payload)
-    
-    def add_motilaloswal_account(self):
-        def show_how_to_dialog():
-            self.how_to_dialog = HowToAddMotilalOswalDialog()
-            self.how_to_dialog.show()
-
-        motilaloswal_account_dialog = AddMotilalOswalAccountDialog(show_how_to_dialog)
-        motilaloswal_account_dialog.show()
-        if motilaloswal_account_dialog.exec_():
-            payload = motilaloswal_account_dialog.get_inputs()
-            self.add_to_account_list("motilal", payload)
-
-    def add_dhan_account(self):
-        def show_how_to_dialog():
-            self.how_to_dialog = HowToAddDhanDialog()
-            self.how_to_dialog.show()
-
-        dhan_account_dialog = AddDhanAccountDialog(show_how_to_dialog)
-        dhan_account_dialog.show()
-        if dhan_account_dialog.exec_():
-            payload = dhan_account_dialog.get_inputs()
-            self.add_to_account_list("dhan", payload)
-
-    def add_firstock_account(self):
-        def show_how_to_dialog():
-            self.how_to_dialog = HowToAddDhanDialog()
-            self.how_to_dialog.show()
-
-        firstock_account_dialog = AddFirstockAccountDialog(show_how_to_dialog)
-        firstock_account_dialog.show()
-        if firstock_account_dialog.exec_():
-            payload = firstock_account_dialog.get_inputs()
-            self.add_to_account_list("firstock", payload)
-
-    def add_pocketful_account(self):
-        pocketful_account_dialog = AddPocketfulAccountDialog()
-        pocketful_account_dialog.show()
-        if pocketful_account_dialog.exec_():
-            payload = pocketful_account_dialog.get_inputs()
-            self.add_to_account_list("pocketful", payload)
+            dialog.current_step_index = 0
+            dialog.show_step()
+        dialog.show()
+        dialog.raise_()
+
+    def clear_dialog_cache(self):
+        for dialog in (*self._dialog_cache.values(), *self._how_to_cache.values()):
+            dialog.deleteLater()
+        self._dialog_cache.clear()
+        self._how_to_cache.clear()
+
+    def _add_account(self, broker):
+        dialog = self._account_dialog(broker)
+        dialog.set_inputs({})
+        dialog.show()
+        if dialog.exec_():
+            payload = dialog.get_inputs()
+            self.add_to_account_list(broker, payload)
 
     def add_to_account_list(self, broker, data):
         data['added_on'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         data['last_login'] = ""
         data['status'] = "Logged Out"
-        file_available = os.path.exists(f"{self.data_dir}/accounts.json")
-        if not file_available:
-            with open(f"{self.data_dir}/accounts.json", "w") as f:
-                json.dump({}, f)
-        with open(f"{self.data_dir}/accounts.json", "r") as f:
-            accounts = json.load(f)
-        if broker not in accounts:
-            accounts[broker] = []
-        accounts[broker].append(data)
-        with open(f"{self.data_dir}/accounts.json", "w") as f:
-            json.dump(accounts, f)
+        self.store.add(broker, data)
 
         self.refresh_accounts_in_table()
     
     def login_to_failed_accounts(self):
         # Count failed/logged out accounts
         try:
-            with open(f"{self.data_dir}/accounts.json", "r") as f:
-                accounts = json.load(f)
-            failed = sum(
-                1 for broker_accounts in accounts.values()
-                for acc in broker_accounts
-                if acc.get('status') in ['Login Failed', 'Logged Out', '']
-            )
-        except:
+            counts = self.store.status_counts()
+            failed = counts['Login Failed'] + counts['Logged Out'] + counts['']
+        except (OSError, ValueError) as e:
+            # Unreadable or corrupt accounts.json
+            logging.warning(f"Could not read accounts.json: {e}", exc_info=e)
             failed = 0
 
         if failed == 0:
@@ -1000,14 +896,12 @@ class AutoLogin(QMainWindow):
         if reply == QMessageBox.No:
             return
 
-        self.on_login_started()
-        self.executor_worker = ExecutorWorker(self.data_dir, all_login=False, is_headless=self.is_headless)
-        self.executor_worker.status.connect(self.update_status)
-        self.executor_worker.finished.connect(self.on_login_finished) 
-        self.executor_worker.start()
+        self.start_executor_worker(all_login=False)
         
     def ensure_browser_ready(self):
         """Ensure Playwright browser is installed on first run."""
+        from autologin.utils.install_browser import ensure_browser_installed
+
         progress = QProgressDialog(
             "Setting up browser (first-time only)...",
             None,
@@ -1043,98 +937,36 @@ class AutoLogin(QMainWindow):
                 fail_box_alert("Error", "Please select only one account to modify")
                 return
 
-            selected_row = selected_rows[0].row()
-            # if selected_row == -1: # Redundant with above check
-            #    fail_box_alert("Error", "Select an account to modify")
-            #    return
-
-            # Use data directly from the model to ensure sorted order is respected
-            model = self.accounts_table.model()
-            if not model:
-                return
-                
-            account_data = model._data.iloc[selected_row]
-            
-            # Helper to reverse map broker display name to internal ID
-            reverse_broker_map = {
-                "Angel One": "angel_one",
-                "Zerodha": "zerodha",
-                "Upstox": "upstox",
-                "Sharekhan": "sharekhan",
-                "Motilal Oswal": "motilal",
-                "Nuvama": "nuvama",
-                "KotakNeo": "kotakneo",
-                "Jainam Lite": "jainamlite",
-                "Fyers": "fyers",
-                "5Paisa": "fivepaisa",
-                "Dhan": "dhan",
-                "Firstock": "firstock",
-                "Pocketful": "pocketful",
-            }
+            account_data = self.get_row_data(selected_rows[0])
             
             display_broker = account_data["Broker"]
-            broker = reverse_broker_map.get(display_broker)
+            broker = _BROKER_KEYS.get(display_broker)
             if not broker:
                  # Fallback/Edge case: try lowercased with underscore if not found in map
                  broker = display_broker.lower().replace(" ", "_")
                  
             client_id = account_data["Client ID"]
 
-            broker_dialog_map = {
-                "angel_one": AddAngelOneAccountDialog,
-                "zerodha": AddZerodhaAccountDialog,
-                "upstox": AddUpstoxAccountDialog,
-                "sharekhan": AddSharekhanAccountDialog,
-                "nuvama": AddNuvamaAccountDialog,
-                "motilal": AddMotilalOswalAccountDialog,
-                "jainamlite": AddJainamLiteAccountDialog,
-                "kotakneo": AddKotakNeoAccountDialog,
-                "fyers" : AddFyersAccountDialog,
-                "fivepaisa" : AddFivePaisaAccountDialog,
-                "dhan" : AddDhanAccountDialog,
-                "firstock" : AddFirstockAccountDialog,
-                "pocketful" : AddPocketfulAccountDialog,
-            }
-
-            if broker not in broker_dialog_map:
+            if broker not in _BROKER_DIALOGS:
                 fail_box_alert("Error", "Unsupported broker")
                 return
 
-            def noop(): pass
+            # Populate from the stored account itself rather than the display row
+            account = next(
+                (acc for acc in self.store.load().get(broker, []) if acc.get("client_id") == client_id),
+                None
+            )
+            if account is None:
+                fail_box_alert("Error", "Account not found")
+                return
+            account_data = dict(account)
 
-            if broker == "pocketful":
-                dialog = broker_dialog_map[broker]()
-            else:
-                dialog = broker_dialog_map[broker](noop)
-            
-            # Map Title Case display keys back to snake_case for the dialog
-            data_map = {
-                "Client ID": "client_id",
-                "Password": "password",
-                "MPIN": "mpin",
-                "TOTP Key": "totp_key",
-                "API Key": "api_key",
-                "API Secret": "api_secret",
-                "Mobile Number": "mobile_number",
-                "Added On": "added_on",
-                "Last Login": "last_login",
-                "Status": "status",
-                "pin": "pin" # Legacy/fallback
-            }
-            
-            raw_data = account_data.to_dict()
-            mapped_data = {}
-            for key, value in raw_data.items():
-                if key in data_map:
-                    mapped_data[data_map[key]] = value
-                else:
-                    mapped_data[key.lower().replace(" ", "_")] = value
-            
             # Special handling for PIN/MPIN consolidation
-            if "pin" in mapped_data and mapped_data["pin"] and not mapped_data.get("mpin"):
-                 mapped_data["mpin"] = mapped_data["pin"]
+            if account_data.get("pin") and not account_data.get("mpin"):
+                 account_data["mpin"] = account_data["pin"]
 
-            dialog.set_inputs(mapped_data)
+            dialog = self._account_dialog(broker)
+            dialog.set_inputs(account_data)
 
             dialog.show()
             if dialog.exec_():
@@ -1146,30 +978,22 @@ class AutoLogin(QMainWindow):
             fail_box_alert("Crash Error", f"An error occurred: {e}")
 
     def update_account_in_json(self, broker, client_id, new_data):
-        file_path = self.data_dir / "accounts.json"
-        with open(file_path, "r") as f:
-            accounts = json.load(f)
+        accounts = self.store.load()
 
         if broker not in accounts:
             fail_box_alert("Error", "Broker not found")
             return
 
-        updated = False
-        for i, acc in enumerate(accounts[broker]):
-            if acc["client_id"] == client_id:
-                new_data["added_on"] = acc["added_on"]
-                new_data["last_login"] = acc.get("last_login", "")
-                new_data["status"] = acc.get("status", "Logged Out")
-                accounts[broker][i] = new_data
-                updated = True
-                break
-
-        if not updated:
+        acc = next((a for a in accounts[broker] if a["client_id"] == client_id), None)
+        if acc is None:
             fail_box_alert("Error", "Account not found")
             return
 
-        with open(file_path, "w") as f:
-            json.dump(accounts, f)
+        new_data["added_on"] = acc["added_on"]
+        new_data["last_login"] = acc.get("last_login", "")
+        new_data["status"] = acc.get("status", "Logged Out")
+        # Journals just this account instead of rewriting accounts.json
+        self.store.put(broker, client_id, new_data)
         self.refresh_accounts_in_table()
         ok_box_alert("Success", f"{client_id} updated successfully!")
 
@@ -1178,21 +1002,51 @@ class AutoLogin(QMainWindow):
         Check for updates silently. 
         Only show dialog if update is available.
         No status bar messages for 'no update' or 'checking' to avoid spamming.
+
+        The periodic timer is re-armed only once a check succeeds. After a
+        failure (e.g. offline) no further periodic checks are scheduled
+        until the app is restarted or the user checks manually.
         """
+        # requests and the updater are only imported once a check is due
+        from autologin.utils.updater import UpdateChecker
+
         def on_update_available(new_version, download_url, release_notes):
             self.show_update_dialog_signal.emit(new_version, download_url, release_notes)
+            self.update_check_succeeded.emit()
         
-        # No-op for no update or error in silent mode
-        def on_no_update(): pass
+        def on_no_update():
+            self.update_check_succeeded.emit()
+
+        # Errors stay silent and leave the timer stopped
         def on_error(e): pass
         
         self.update_checker = UpdateChecker(
             on_update_available=on_update_available,
             on_no_update=on_no_update,
             on_error=on_error,
-            on_checking=None # No checking message
+            on_checking=None, # No checking message
+            cache_file=self.get_update_check_file()  # Reuse a recent result
         )
-        self.update_checker.check_async()
+        last_ok = self._update_check_ok
+        # Set again by _on_update_check_succeeded(), possibly synchronously
+        # when check_async() answers from the cache
+        self._update_check_ok = False
+        if not self.update_checker.check_async():
+            # Another check is running; keep the previous schedule
+            self._update_check_ok = last_ok
+            self._rearm_update_timer()
+
+    def _on_update_check_succeeded(self):
+        self._update_check_ok = True
+        self._rearm_update_timer()
+
+    def _rearm_update_timer(self):
+        """
+        Schedule the next periodic check if the last one succeeded and the
+        window isn't minimized.
+        """
+        if self._update_check_ok and not self.isMinimized() and not self.update_timer.isActive():
+            self.update_timer.start()
     
     def check_for_updates_on_startup(self):
         # Kept for backward compatibility if needed, but we used silent for startup too
@@ -1201,28 +1055,36 @@ class AutoLogin(QMainWindow):
     
     def check_for_updates_manual(self):
         """Check for updates with UI feedback (triggered from menu)."""
-        self.statusBar().showMessage("Checking for updates...", 3000)
-        
-        def on_update_available(new_version, download_url, release_notes):
-            QTimer.singleShot(0, lambda: self._show_update_dialog(
-                new_version, download_url, release_notes
-            ))
-        
-        def on_no_update():
-            QTimer.singleShot(0, lambda: self._show_no_update_dialog())
-        
-        def on_error(error):
-            QTimer.singleShot(0, lambda: fail_box_alert(
-                "Update Check Failed", 
-                f"Could not check for updates:\n{error}"
-            ))
-        
-        self.update_checker = UpdateChecker(
-            on_update_available=on_update_available,
-            on_no_update=on_no_update,
-            on_error=on_error
-        )
-        self.update_checker.check_async()
+        from autologin.dialogs.update_dialog import CheckingUpdateDialog, CheckUpdateWorker
+
+        # Always ask GitHub, but refresh the cache for the silent checks
+        worker = CheckUpdateWorker(self.get_update_check_file(), self)
+        results = []
+        worker.result.connect(results.append)
+        worker.finished.connect(worker.deleteLater)
+
+        # The dialog closes itself when the worker is done
+        dialog = CheckingUpdateDialog(self)
+        dialog.setAttribute(Qt.WA_DeleteOnClose)
+        worker.finished.connect(dialog.accept)
+        worker.start()
+        if not dialog.exec_() or not results:
+            # Dismissed with Escape; let the check finish in the background
+            return
+
+        has_update, new_version, download_url, notes = results[0]
+        if new_version:
+            # A successful check resumes periodic checks stopped by a failure
+            self._on_update_check_succeeded()
+        if has_update:
+            self._show_update_dialog(new_version, download_url, notes)
+        elif new_version:
+            self._show_no_update_dialog()
+        else:
+            fail_box_alert(
+                "Update Check Failed",
+                f"Could not check for updates:\n{notes}"
+            )
 
     def show_log_console(self):
         """Show the log console window."""
@@ -1236,6 +1098,9 @@ class AutoLogin(QMainWindow):
     
     def _show_update_dialog(self, new_version, download_url, release_notes):
         """Show the update available dialog."""
+        from autologin.dialogs.update_dialog import UpdateAvailableDialog
+        from autologin.utils.updater import get_current_version
+
         current_version = get_current_version()
         
         dialog = UpdateAvailableDialog(
@@ -1252,12 +1117,17 @@ class AutoLogin(QMainWindow):
     
     def _show_no_update_dialog(self):
         """Show dialog indicating no update is available."""
+        from autologin.dialogs.update_dialog import NoUpdateDialog
+        from autologin.utils.updater import get_current_version
+
         current_version = get_current_version()
         dialog = NoUpdateDialog(self, current_version)
         dialog.exec_()
     
     def _start_update_download(self, download_url):
         """Start downloading the update."""
+        from autologin.dialogs.update_dialog import UpdateProgressDialog
+
         progress_dialog = UpdateProgressDialog(self, download_url)
         progress_dialog.start_download()
         
@@ -1270,6 +1140,46 @@ class AutoLogin(QMainWindow):
             )
             self.close()
 
+def _acquire_instance_lock(data_dir):
+    """
+    Take the single-instance lock without touching the disk where possible.
+    Returns the object holding the lock, or None if another instance has it.
+    """
+    system = platform.system()
+    if system == "Linux":
+        # Abstract-namespace socket: no file, released by the kernel on exit
+        import socket
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.bind(f"\0autologin_lock_{os.getuid()}")
+        except OSError:
+            sock.close()
+            return None
+        return sock
+
+    if system == "Windows":
+        # Named mutex, released by Windows when the process exits
+        import ctypes
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        handle = kernel32.CreateMutexW(None, False, "Local\\AutoLoginMutex")
+        if not handle:
+            return None
+        if ctypes.get_last_error() == 183:  # ERROR_ALREADY_EXISTS
+            kernel32.CloseHandle(handle)
+            return None
+        return handle
+
+    # macOS has no abstract sockets; fall back to flock on a lock file
+    import fcntl
+    lock_file = open(data_dir / ".app_lock", "w")
+    try:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        lock_file.close()
+        return None
+    return lock_file
+
+
 def main():
     # Linux desktop environments use an app's .desktop file to integrate the app
     # in to their application menus. The .desktop file of this app will include
@@ -1280,29 +1190,14 @@ def main():
     # set to match the value set in app's desktop file. For PySide6, this is set
     # with setApplicationName().
 
-    # Single-instance lock to prevent multiple app instances
+    # Single-instance lock to prevent multiple app instances.
+    # Held for the life of the process; the OS drops it on exit
     data_dir = get_data_dir()
     data_dir.mkdir(parents=True, exist_ok=True)
-    lock_file_path = data_dir / ".app_lock"
-    lock_file = None
-    
-    # Try to acquire a cross-platform file lock
-    try:
-        lock_file = open(lock_file_path, 'w')
-        if platform.system() == "Windows":
-            import msvcrt
-            msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
-        else:
-            import fcntl
-            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
-        # Write PID to help with debugging
-        lock_file.write(str(os.getpid()))
-        lock_file.flush()
-    except (IOError, OSError):
+    instance_lock = _acquire_instance_lock(data_dir)
+    if instance_lock is None:
         # Another instance is running - exit silently
         print("Another instance of AutoLogin is already running. Exiting.")
-        if lock_file:
-            lock_file.close()
         sys.exit(0)
 
     # Find the name of the module that was used to start the app
@@ -1318,18 +1213,5 @@ def main():
     
     exit_code = app.exec()
     
-    # Release the lock on exit
-    try:
-        if platform.system() == "Windows":
-            import msvcrt
-            msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
-        else:
-            import fcntl
-            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
-        lock_file.close()
-        lock_file_path.unlink(missing_ok=True)
-    except Exception:
-        pass
-    
     sys.exit(exit_code)
 
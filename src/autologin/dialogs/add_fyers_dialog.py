@@ -1,5 +1,5 @@
 from PyQt5.QtWidgets import QDialog
-from PyQt5 import uic
+from autologin.utils.ui_loader import load_ui
 import os
 
 
@@ -7,7 +7,7 @@ class AddFyersAccountDialog(QDialog):
     def __init__(self, call_back_fn):
         super(AddFyersAccountDialog, self).__init__()
         current_directory = os.path.dirname(os.path.abspath(__file__))
-        uic.loadUi(os.path.join(current_directory, "..", "ui", "fyers_dialog.ui"), self)
+        load_ui(os.path.join(current_directory, "..", "ui", "fyers_dialog.ui"), self)
         self.setWindowTitle("Add Fyers Account")
         self.how_to_button.clicked.connect(call_back_fn)
 
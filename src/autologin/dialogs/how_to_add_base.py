@@ -0,0 +1,90 @@
+import os
+import webbrowser
+
+from PyQt5.QtWidgets import QDialog, QLabel, QPushButton
+from autologin.utils.ui_loader import load_pixmap, load_ui
+
+# Resolved once at import instead of per dialog; __file__ is already
+# absolute for an imported module, so no abspath() is needed
+_HERE = os.path.dirname(__file__)
+UI_DIR = os.path.normpath(os.path.join(_HERE, "..", "ui"))
+IMG_DIR = os.path.normpath(os.path.join(_HERE, "..", "resources", "images"))
+
+
+class HowToAddBase(QDialog):
+    """
+    Step-by-step guide shared by every broker's "How to" dialog.
+
+    Args:
+        ui_file: .ui file name in the ui/ directory
+        title: Window title
+        steps: List of (step text, image file name in resources/images)
+    """
+
+    def __init__(self, ui_file, title, steps):
+        super().__init__()
+        load_ui(os.path.join(UI_DIR, ui_file), self)
+        self.setWindowTitle(title)
+
+        self.current_step_index = 0
+        self.steps = steps
+
+        # Label text for each step, with any URL already turned into a link
+        self._rendered = [self._render(step_text) for step_text, _ in self.steps]
+
+        # Resolve and decode every step image up front, so show_step() only
+        # indexes a list; None marks a missing file
+        self._pixmaps = []
+        for _, image_file in self.steps:
+            image_path = os.path.join(IMG_DIR, image_file)
+            self._pixmaps.append(load_pixmap(image_path) if os.path.exists(image_path) else None)
+
+        self.stepLabel = self.findChild(QLabel, "stepLabel")
+        self.imageLabel = self.findChild(QLabel, "imageLabel")
+        self.nextButton = self.findChild(QPushButton, "nextButton")
+        self.prevButton = self.findChild(QPushButton, "prevButton")
+
+        self.stepLabel.setOpenExternalLinks(False)
+        self.stepLabel.linkActivated.connect(self.handle_link_click)
+        self.nextButton.clicked.connect(self.next_step)
+        self.prevButton.clicked.connect(self.prev_step)
+
+        self.show_step()
+
+    @staticmethod
+    def _render(step_text):
+        """Return the label text for a step, with any URL turned into a link."""
+        idx = step_text.find("http")
+        if idx >= 0:
+            prefix, url = step_text[:idx], step_text[idx:]
+            return f"{prefix}<a href='{url}'>{url}</a>"
+        return step_text
+
+    def show_step(self):
+        self.stepLabel.setText(self._rendered[self.current_step_index])
+
+        pixmap = self._pixmaps[self.current_step_index]
+        if pixmap is not None:
+            self.imageLabel.setPixmap(pixmap)
+        else:
+            self.imageLabel.setText("Image not found.")
+
+        self.prevButton.setEnabled(self.current_step_index > 0)
+        self.nextButton.setEnabled(True)
+
+        self.nextButton.setText("Finish" if self.current_step_index == len(self.steps) - 1 else "Next >")
+
+    def next_step(self):
+        if self.current_step_index < len(self.steps) - 1:
+            self.current_step_index += 1
+            self.show_step()
+        else:
+            self.accept()
+
+    def prev_step(self):
+        if self.current_step_index > 0:
+            self.current_step_index -= 1
+            self.show_step()
+
+    def handle_link_click(self, url):
+        webbrowser.open(url)
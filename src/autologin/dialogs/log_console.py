@@ -1,18 +1,41 @@
 
 import sys
 import logging
+import threading
 from PyQt5 import QtWidgets, QtGui, QtCore
 
+# Oldest lines are dropped from the console past this many
+MAX_LOG_LINES = 5000
+
 class LogStream(QtCore.QObject):
-    """Stream object that emits signals when written to."""
+    """
+    Stream object that emits signals when written to.
+    Text is buffered and emitted a whole line at a time, so print() costs
+    one signal instead of one for the text and another for the newline.
+    """
     messageWritten = QtCore.pyqtSignal(str)
 
+    def __init__(self):
+        super().__init__()
+        self._buf = ""
+        # print() may be called from worker threads too
+        self._lock = threading.Lock()
+
     def write(self, text):
-        if text:
-            self.messageWritten.emit(str(text))
-    
+        if not text:
+            return
+        with self._lock:
+            self._buf += str(text)
+            if "\n" not in self._buf:
+                return
+            lines, _, self._buf = self._buf.rpartition("\n")
+        self.messageWritten.emit(lines + "\n")
+
     def flush(self):
-        pass
+        with self._lock:
+            text, self._buf = self._buf, ""
+        if text:
+            self.messageWritten.emit(text)
 
 class LogConsole(QtWidgets.QDialog):
     """
@@ -20,15 +43,22 @@ class LogConsole(QtWidgets.QDialog):
     Useful for debugging in production (packaged apps).
     """
     # Define signal for thread-safe logging from handler
-    new_log_record = QtCore.pyqtSignal(object)
+    new_log_html = QtCore.pyqtSignal(str)
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Application Logs")
         self.resize(800, 600)
         
-        # Connect signals
-        self.new_log_record.connect(self.append_log_record)
+        # Connect signals. Always queued: records and output only ever carry
+        # plain strings, and are written to the console on the GUI thread
+        # whichever thread produced them
+        self.new_log_html.connect(self.append_log_html, QtCore.Qt.QueuedConnection)
+
+        # Output waiting to be written to text_edit, as (new_line, html).
+        # Bursts are written in one go by _flush instead of one relayout per line.
+        self._pending = []
+        self._flush_scheduled = False
         
         layout = QtWidgets.QVBoxLayout(self)
         
@@ -39,6 +69,9 @@ class LogConsole(QtWidgets.QDialog):
         font = QtGui.QFont("Monospace")
         font.setStyleHint(QtGui.QFont.Monospace)
         self.text_edit.setFont(font)
+        # Keep only the newest lines so long sessions don't grow the
+        # document (and the cost of every insert) without bound
+        self.text_edit.document().setMaximumBlockCount(MAX_LOG_LINES)
         layout.addWidget(self.text_edit)
         
         # Controls
@@ -81,16 +114,19 @@ class LogConsole(QtWidgets.QDialog):
             '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
             datefmt='%H:%M:%S'
         ))
+        # Start at the level shown in the combo; otherwise DEBUG records are
+        # sent across to the GUI thread until the user first changes it
+        self._update_filter(self.level_combo.currentText())
         logging.getLogger().addHandler(self.handler)
         
         # Redirect stdout/stderr
         self.stdout_stream = LogStream()
-        self.stdout_stream.messageWritten.connect(self.append_stdout)
+        self.stdout_stream.messageWritten.connect(self.append_stdout, QtCore.Qt.QueuedConnection)
         self.original_stdout = sys.stdout
         sys.stdout = self.stdout_stream
 
         self.stderr_stream = LogStream()
-        self.stderr_stream.messageWritten.connect(self.append_stderr)
+        self.stderr_stream.messageWritten.connect(self.append_stderr, QtCore.Qt.QueuedConnection)
         self.original_stderr = sys.stderr
         sys.stderr = self.stderr_stream
 
@@ -106,37 +142,53 @@ class LogConsole(QtWidgets.QDialog):
             with open(filename, 'w') as f:
                 f.write(self.text_edit.toPlainText())
 
-    def append_log_record(self, record):
-        """Slot to append log record."""
-        msg = self.handler.format(record)
-        # Color coding for logs
-        color = "#000000"  # Black
-        if record.levelno >= logging.ERROR:
-            color = "#FF0000"  # Red
-        elif record.levelno >= logging.WARNING:
-            color = "#FF8C00"  # Orange
-        elif record.levelno == logging.DEBUG:
-            color = "#808080"  # Gray
-        
-        html = f'<span style="color:{color}">{msg}</span>'
-        self.text_edit.append(html)
-        self._check_scroll()
+    def append_log_html(self, html):
+        """Slot to append a log record already rendered by QtLogHandler."""
+        self._queue(True, html)
 
     def append_stdout(self, text):
         """Slot for stdout text."""
-        # Clean up newlines for HTML
-        text = text.replace("\n", "<br>")
-        html = f'<span style="color:#000080">{text}</span>'  # Navy blue for stdout
-        self.text_edit.insertHtml(html)
-        self._check_scroll()
+        self._queue_stream(text, "#000080")  # Navy blue for stdout
 
     def append_stderr(self, text):
         """Slot for stderr text."""
-        text = text.replace("\n", "<br>")
-        html = f'<span style="color:#8B0000">{text}</span>'  # Dark red for stderr
-        self.text_edit.insertHtml(html)
+        self._queue_stream(text, "#8B0000")  # Dark red for stderr
+
+    def _queue_stream(self, text, color):
+        # Each output line becomes its own block, so the block cap counts lines
+        for i, line in enumerate(text.split("\n")):
+            self._queue(i > 0, f'<span style="color:{color}">{line}</span>')
+
+    def _queue(self, new_line, html):
+        """Hold output for the next _flush, scheduling one if needed."""
+        self._pending.append((new_line, html))
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            QtCore.QTimer.singleShot(16, self._flush)
+
+    def _flush(self):
+        """Write all pending output with a single relayout and repaint."""
+        self._flush_scheduled = False
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+
+        document = self.text_edit.document()
+        cursor = QtGui.QTextCursor(document)
+        cursor.movePosition(QtGui.QTextCursor.End)
+        self.text_edit.setUpdatesEnabled(False)
+        cursor.beginEditBlock()
+        try:
+            for new_line, html in pending:
+                # Log records start their own line, like QTextEdit.append()
+                if new_line and not document.isEmpty():
+                    cursor.insertBlock()
+                cursor.insertHtml(html)
+        finally:
+            cursor.endEditBlock()
+            self.text_edit.setUpdatesEnabled(True)
         self._check_scroll()
-        
+
     def _check_scroll(self):
         if self.autoscroll_check.isChecked():
             self.text_edit.moveCursor(QtGui.QTextCursor.End)
@@ -160,8 +212,18 @@ class QtLogHandler(logging.Handler):
         self.widget = widget
         
     def emit(self, record):
-        # Emit signal to update GUI on main thread
+        # Format and colorize on the logging thread, then hand the finished
+        # HTML to the GUI thread
         try:
-            self.widget.new_log_record.emit(record)
+            msg = self.format(record)
+            # Color coding for logs
+            color = "#000000"  # Black
+            if record.levelno >= logging.ERROR:
+                color = "#FF0000"  # Red
+            elif record.levelno >= logging.WARNING:
+                color = "#FF8C00"  # Orange
+            elif record.levelno == logging.DEBUG:
+                color = "#808080"  # Gray
+            self.widget.new_log_html.emit(f'<span style="color:{color}">{msg}</span>')
         except Exception:
             pass
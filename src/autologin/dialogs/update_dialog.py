@@ -1,11 +1,91 @@
 """Update dialog for AutoLogin application."""
 
 import webbrowser
+from pathlib import Path
 from PyQt5 import QtWidgets, QtCore, QtGui
 from typing import Optional
-import threading
 
-from autologin.utils.updater import download_update, apply_update, GITHUB_REPO
+from autologin.utils.updater import (
+    download_update, apply_update, check_for_updates_exclusive, save_cached_check, GITHUB_REPO
+)
+
+
+# (standard pixmap, size) -> scaled QPixmap, shared by every dialog
+_ICON_CACHE = {}
+
+
+def _std_icon(style, standard_pixmap, size):
+    """Return a style's standard pixmap scaled to size x size, scaling it only once."""
+    key = (int(standard_pixmap), size)
+    pixmap = _ICON_CACHE.get(key)
+    if pixmap is None:
+        pixmap = _ICON_CACHE[key] = style.standardPixmap(standard_pixmap).scaled(size, size)
+    return pixmap
+
+
+class CheckUpdateWorker(QtCore.QThread):
+    """
+    Asks GitHub for the latest release on its own thread.
+
+    Signals:
+        result: Emits the check_for_updates() tuple
+            (has_update, latest_version, download_url, notes_or_error)
+    """
+
+    result = QtCore.pyqtSignal(object)
+
+    def __init__(self, cache_file=None, parent: Optional[QtCore.QObject] = None):
+        super().__init__(parent)
+        self.cache_file = cache_file
+
+    def run(self):
+        # Started by the user, so don't answer from the release cache, but
+        # don't race a silent check that is already talking to GitHub
+        result = check_for_updates_exclusive(force_refresh=True)
+        if self.cache_file:
+            save_cached_check(self.cache_file, result)
+        self.result.emit(result)
+
+
+class DownloadWorker(QtCore.QThread):
+    """
+    Downloads an update file on its own thread.
+
+    Signals:
+        progress: Emits (downloaded_bytes, total_bytes) up to ~10 times a second
+        complete: Emits the path of the downloaded file
+        failed: Emits an error message
+    """
+
+    progress = QtCore.pyqtSignal(int, int)
+    complete = QtCore.pyqtSignal(str)
+    failed = QtCore.pyqtSignal(str)
+
+    def __init__(self, download_url: str, parent: Optional[QtCore.QObject] = None):
+        super().__init__(parent)
+        self.download_url = download_url
+        self._cancelled = False
+
+    def cancel(self):
+        """Stop after the chunk currently being read; nothing is emitted."""
+        self._cancelled = True
+
+    def run(self):
+        # download_update() already coalesces progress, and the queued
+        # signal carries it to the GUI thread
+        path = download_update(
+            self.download_url,
+            self.progress.emit,
+            lambda: self._cancelled
+        )
+
+        if self._cancelled:
+            return
+
+        if path:
+            self.complete.emit(str(path))
+        else:
+            self.failed.emit("Failed to download update file. Please try again.")
 
 
 class UpdateAvailableDialog(QtWidgets.QDialog):
@@ -32,9 +112,7 @@ class UpdateAvailableDialog(QtWidgets.QDialog):
         header_layout = QtWidgets.QHBoxLayout()
         
         icon_label = QtWidgets.QLabel()
-        icon_label.setPixmap(
-            self.style().standardPixmap(QtWidgets.QStyle.SP_ArrowUp).scaled(48, 48)
-        )
+        icon_label.setPixmap(_std_icon(self.style(), QtWidgets.QStyle.SP_ArrowUp, 48))
         header_layout.addWidget(icon_label)
         
         header_text = QtWidgets.QLabel(
@@ -53,8 +131,17 @@ class UpdateAvailableDialog(QtWidgets.QDialog):
         if release_notes:
             notes_group = QtWidgets.QGroupBox("What's New")
             notes_layout = QtWidgets.QVBoxLayout(notes_group)
-            notes_text = QtWidgets.QTextBrowser()
-            notes_text.setOpenExternalLinks(True)
+            # Only notes with links need a browser; plain notes go into the
+            # lighter QPlainTextEdit, which skips rich-text layout
+            has_links = "http" in release_notes and "<a" not in release_notes
+            if has_links:
+                notes_text = QtWidgets.QTextBrowser()
+                notes_text.setOpenExternalLinks(True)
+            else:
+                notes_text = QtWidgets.QPlainTextEdit()
+                notes_text.setReadOnly(True)
+            # Never edited, so don't keep an undo history
+            notes_text.document().setUndoRedoEnabled(False)
             
             # Force colors using Palette (more reliable than CSS on some platforms)
             palette = notes_text.palette()
@@ -64,7 +151,7 @@ class UpdateAvailableDialog(QtWidgets.QDialog):
             
             # Basic link detection via HTML
             # Simple conversion of URLs to links if text is plain
-            if "http" in release_notes and "<a" not in release_notes:
+            if has_links:
                 # Very basic linkify for display
                 html_notes = release_notes.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
                 html_notes = html_notes.replace("\n", "<br>")
@@ -79,7 +166,7 @@ class UpdateAvailableDialog(QtWidgets.QDialog):
                 
             notes_text.setMaximumHeight(200)
             notes_text.setStyleSheet(
-                "QTextBrowser { background-color: #ffffff; color: #000000; "
+                f"{type(notes_text).__name__} {{ background-color: #ffffff; color: #000000; "
                 "border: 1px solid #d0d0d0; border-radius: 4px; padding: 10px; "
                 "font-size: 12px; font-family: sans-serif; }"
             )
@@ -143,10 +230,6 @@ class UpdateAvailableDialog(QtWidgets.QDialog):
 class UpdateProgressDialog(QtWidgets.QDialog):
     """Dialog showing download progress."""
     
-    progress_updated = QtCore.pyqtSignal(int, int)
-    download_complete = QtCore.pyqtSignal(str)
-    download_failed = QtCore.pyqtSignal(str)
-    
     def __init__(self, parent: Optional[QtWidgets.QWidget], download_url: str):
         super().__init__(parent)
         self.download_url = download_url
@@ -161,13 +244,16 @@ class UpdateProgressDialog(QtWidgets.QDialog):
         # Icon and title
         header_layout = QtWidgets.QHBoxLayout()
         icon_label = QtWidgets.QLabel()
-        icon_label.setPixmap(
-            self.style().standardPixmap(QtWidgets.QStyle.SP_ArrowDown).scaled(32, 32)
-        )
+        icon_label.setPixmap(_std_icon(self.style(), QtWidgets.QStyle.SP_ArrowDown, 32))
         header_layout.addWidget(icon_label)
         
-        self.status_label = QtWidgets.QLabel("<b>Downloading update...</b>")
-        self.status_label.setTextFormat(QtCore.Qt.RichText)
+        # Plain text in a bold font: the label is updated several times and
+        # there's no markup worth running through the HTML parser
+        self.status_label = QtWidgets.QLabel("Downloading update...")
+        self.status_label.setTextFormat(QtCore.Qt.PlainText)
+        status_font = self.status_label.font()
+        status_font.setBold(True)
+        self.status_label.setFont(status_font)
         header_layout.addWidget(self.status_label, 1)
         layout.addLayout(header_layout)
         
@@ -189,35 +275,24 @@ class UpdateProgressDialog(QtWidgets.QDialog):
         self.cancel_btn.clicked.connect(self._on_cancel)
         layout.addWidget(self.cancel_btn, alignment=QtCore.Qt.AlignCenter)
         
-        # Connect signals
-        self.progress_updated.connect(self._on_progress)
-        self.download_complete.connect(self._on_complete)
-        self.download_failed.connect(self._on_failed)
+        # The worker is a child of the dialog, so the dialog must not close
+        # until the thread has finished (see reject())
+        self._worker = DownloadWorker(download_url, self)
+        self._worker.progress.connect(self._on_progress, QtCore.Qt.QueuedConnection)
+        self._worker.complete.connect(self._on_complete, QtCore.Qt.QueuedConnection)
+        self._worker.failed.connect(self._on_failed, QtCore.Qt.QueuedConnection)
+        self._worker.finished.connect(self._on_worker_finished, QtCore.Qt.QueuedConnection)
         
         self._cancelled = False
         self._download_path = None
     
     def start_download(self):
         """Start the download in a background thread."""
-        thread = threading.Thread(target=self._download_worker, daemon=True)
-        thread.start()
+        self._worker.start()
     
-    def _download_worker(self):
-        """Background worker for downloading."""
-        def progress_callback(downloaded, total):
-            if not self._cancelled:
-                self.progress_updated.emit(downloaded, total)
-        
-        path = download_update(self.download_url, progress_callback)
-        
+    def _on_worker_finished(self):
         if self._cancelled:
-            return
-        
-        if path:
-            self._download_path = path
-            self.download_complete.emit(str(path))
-        else:
-            self.download_failed.emit("Failed to download update file. Please try again.")
+            super().reject()
     
     def _on_progress(self, downloaded: int, total: int):
         if total > 0:
@@ -233,7 +308,12 @@ class UpdateProgressDialog(QtWidgets.QDialog):
             self.size_label.setText(f"{downloaded_mb:.1f} MB downloaded")
     
     def _on_complete(self, path: str):
-        self.status_label.setText("<b>Download complete!</b>")
+        if self._cancelled:
+            return
+        # complete is the worker's last act; let the thread end first
+        self._worker.wait()
+        self._download_path = Path(path)
+        self.status_label.setText("Download complete!")
         self.progress_bar.setValue(100)
         self.cancel_btn.setEnabled(False)
         self.size_label.setText("Launching installer...")
@@ -258,13 +338,34 @@ class UpdateProgressDialog(QtWidgets.QDialog):
             self.accept()
     
     def _on_failed(self, error: str):
-        self.status_label.setText("<b>Download failed</b>")
-        QtWidgets.QMessageBox.critical(self, "Download Failed", error)
+        if self._cancelled:
+            return
+        self._worker.wait()
+        self.status_label.setText("Download failed")
+        answer = QtWidgets.QMessageBox.critical(
+            self,
+            "Download Failed",
+            f"{error}\n\nRetry continues from where the download stopped.",
+            QtWidgets.QMessageBox.Retry | QtWidgets.QMessageBox.Cancel
+        )
+        if answer == QtWidgets.QMessageBox.Retry:
+            self.status_label.setText("Downloading update...")
+            self._worker.start()
+            return
         self.reject()
     
     def _on_cancel(self):
-        self._cancelled = True
         self.reject()
+    
+    def reject(self):
+        # Also reached via Escape; close only once the worker has stopped
+        if self._worker.isRunning():
+            self._cancelled = True
+            self._worker.cancel()
+            self.cancel_btn.setEnabled(False)
+            self.size_label.setText("Cancelling...")
+            return
+        super().reject()
 
 
 class NoUpdateDialog(QtWidgets.QMessageBox):
@@ -0,0 +1,318 @@
+"""
+Cached access to accounts.json.
+Reloads the file only when it changes on disk.
+
+Single-account adds and edits are appended to a journal (accounts.log)
+next to accounts.json instead of rewriting the whole file. The journal is
+folded back into accounts.json by the next full save() or compact().
+"""
+
+import json
+import os
+import tempfile
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+
+# Prefer orjson for speed, but fall back to stdlib json if missing
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# The journal is compacted into accounts.json once it grows past this
+COMPACT_SIZE = 1 << 20
+
+# Shared by every store in the process: the GUI, the table refresh thread
+# and the login executor each keep their own instance over the same files
+_LOCK = threading.RLock()
+
+
+def _dumps(obj) -> bytes:
+    if HAS_ORJSON:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(raw: bytes):
+    if HAS_ORJSON:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _stat(path):
+    try:
+        return os.stat(path)
+    except FileNotFoundError:
+        return None
+
+
+def _copy(accounts: dict) -> dict:
+    """Copy the broker lists and account dicts (their values are plain scalars)."""
+    return {broker: [dict(acc) for acc in lst] for broker, lst in accounts.items()}
+
+
+def _apply(accounts: dict, entry: dict):
+    """
+    Apply one journal entry: replace the account with entry["client_id"],
+    or append it. Re-applying an entry is harmless, even when the edit
+    changed the client id.
+    """
+    account = entry["data"]
+    broker_accounts = accounts.setdefault(entry["broker"], [])
+    for client_id in (entry["client_id"], account.get("client_id")):
+        for i, acc in enumerate(broker_accounts):
+            if acc.get("client_id") == client_id:
+                broker_accounts[i] = account
+                return
+    broker_accounts.append(account)
+
+
+class AccountsStore:
+    """
+    Cached reader/writer for the accounts.json file and its journal.
+
+    load() returns a private copy, so callers may mutate it freely (e.g. on
+    the GUI thread while the writer serializes the cache on another one);
+    changes only take effect through save() or put().
+    Inside a batch() block saves only update the cache; the files are
+    written once when the outermost block exits.
+
+    If on_change is given, writes are never done inline: changes are
+    applied to the cache, on_change() is called, and whoever owns the
+    store is expected to call flush() soon after (e.g. on a worker thread).
+    """
+
+    def __init__(self, path, on_change=None):
+        self.path = Path(path)
+        self.log_path = self.path.with_suffix(".log")
+        self._cache = None
+        self._key = None
+        # (inode, offset) of the journal already applied to _cache
+        self._log_pos = None
+        self._counts = None
+        self._batch_depth = 0
+        self.on_change = on_change
+        # Changes applied to _cache but not yet on disk
+        self._pending_entries = []
+        self._pending_save = False
+
+    @property
+    def _dirty(self):
+        return self._pending_save or bool(self._pending_entries)
+
+    def _deferring(self):
+        return bool(self._batch_depth or self.on_change)
+
+    def _notify(self):
+        if not self._batch_depth and self.on_change:
+            self.on_change()
+
+    def stat_key(self):
+        """
+        Return a value that changes whenever accounts.json or its journal
+        changes on disk, or None if neither exists.
+        """
+        snapshot = _stat(self.path)
+        log = _stat(self.log_path)
+        if snapshot is None and log is None:
+            return None
+        return (
+            snapshot.st_mtime_ns if snapshot else None,
+            (log.st_ino, log.st_mtime_ns, log.st_size) if log else None,
+        )
+
+    def _read_journal(self, accounts: dict, pos):
+        """Apply journal entries past pos to accounts and return the new position."""
+        try:
+            f = open(self.log_path, "rb")
+        except FileNotFoundError:
+            return None
+        with f:
+            st = os.fstat(f.fileno())
+            offset = 0
+            if pos and pos[0] == st.st_ino and pos[1] <= st.st_size:
+                offset = pos[1]
+            f.seek(offset)
+            for line in f:
+                # Stop at a torn write left by a crash
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    entry = _loads(line)
+                except ValueError:
+                    break
+                _apply(accounts, entry)
+                offset += len(line)
+        return st.st_ino, offset
+
+    def load(self) -> dict:
+        """Return a copy of the accounts, re-reading the files only if they changed."""
+        with _LOCK:
+            return _copy(self._load())
+
+    def _load(self) -> dict:
+        """Return the cached accounts themselves, not a copy."""
+        with _LOCK:
+            # Unwritten batch changes take precedence over the file
+            if self._dirty:
+                return self._cache
+
+            key = self.stat_key()
+            if self._cache is not None and key == self._key:
+                return self._cache
+
+            accounts = {}
+            try:
+                with open(self.path, "rb") as f:
+                    raw = f.read()
+                if raw.strip():
+                    accounts = _loads(raw)
+            except FileNotFoundError:
+                # No file yet; the first save() creates it
+                pass
+            self._log_pos = self._read_journal(accounts, None)
+            self._cache = accounts
+            self._key = key
+            self._counts = None
+            return self._cache
+
+    def save(self, data: dict):
+        """Atomically write accounts to disk, fold in the journal and refresh the cache."""
+        with _LOCK:
+            self._counts = None
+            # The caller keeps its dict; the cache must not change with it
+            data = _copy(data)
+            if self._deferring():
+                # A full save supersedes any journal entries still pending
+                self._cache = data
+                self._pending_save = True
+                self._pending_entries.clear()
+                self._notify()
+                return
+            self._write_snapshot(data)
+
+    def _write_snapshot(self, data: dict):
+        with _LOCK:
+            # Keep journal entries other store instances wrote since our last load
+            self._read_journal(data, self._log_pos)
+            payload = _dumps(data)
+
+            # Write a sibling temp file and swap it in, so a crash mid-write
+            # never leaves a truncated accounts.json behind
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=".accounts-", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(payload)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                raise
+            # Everything in the journal is now in accounts.json
+            try:
+                os.unlink(self.log_path)
+            except FileNotFoundError:
+                pass
+            self._cache = data
+            self._log_pos = None
+            self._key = self.stat_key()
+
+    def put(self, broker: str, client_id: str, account: dict):
+        """
+        Insert or replace a single account, matched on client_id.
+        Appends one journal line instead of rewriting accounts.json.
+        """
+        with _LOCK:
+            accounts = self._load()
+            entry = {"broker": broker, "client_id": client_id, "data": dict(account)}
+            _apply(accounts, entry)
+            self._counts = None
+            if self._deferring():
+                if not self._pending_save:
+                    self._pending_entries.append(entry)
+                self._notify()
+                return
+            self._write_entries(accounts, [entry])
+
+    def _write_entries(self, accounts: dict, entries: list):
+        with _LOCK:
+            # The journal has entries we haven't seen, or a torn line that
+            # would swallow the next entry: rewrite everything instead
+            log = _stat(self.log_path)
+            if log and (self._log_pos is None or self._log_pos[1] != log.st_size):
+                self._write_snapshot(accounts)
+                return
+
+            # Another store may have rewritten accounts.json since our load
+            changed = self.stat_key() != self._key
+            with open(self.log_path, "ab") as f:
+                f.write(b"".join(_dumps(entry) + b"\n" for entry in entries))
+                f.flush()
+                os.fsync(f.fileno())
+                self._log_pos = (os.fstat(f.fileno()).st_ino, f.tell())
+            # If so, the next load() re-reads it and replays our entries on top
+            self._key = None if changed else self.stat_key()
+
+            if self._log_pos[1] >= COMPACT_SIZE:
+                self._write_snapshot(accounts)
+
+    def flush(self):
+        """Write out changes held back by batch() or on_change."""
+        with _LOCK:
+            if self._pending_save:
+                self._write_snapshot(self._cache)
+            elif self._pending_entries:
+                self._write_entries(self._cache, self._pending_entries)
+            # Only cleared once written, so a failed write is retried
+            self._pending_save = False
+            self._pending_entries = []
+
+    def compact(self):
+        """Write out pending changes and fold the journal into accounts.json."""
+        with _LOCK:
+            self.flush()
+            if self.log_path.exists():
+                self._write_snapshot(self._load())
+
+    def status_counts(self) -> Counter:
+        """Number of accounts per status, recounted only after a reload or save."""
+        with _LOCK:
+            accounts = self._load()
+            if self._counts is None:
+                self._counts = Counter(
+                    acc.get("status") for acc_list in accounts.values() for acc in acc_list
+                )
+            return self._counts
+
+    def add(self, broker: str, account: dict):
+        """Add an account under broker (replacing one with the same client_id)."""
+        self.put(broker, account.get("client_id"), account)
+
+    @contextmanager
+    def batch(self):
+        """Group several add()/put()/save() calls into a single write."""
+        self._batch_depth += 1
+        try:
+            yield self.load()
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._dirty:
+                if self.on_change:
+                    self.on_change()
+                else:
+                    self.flush()
+
+    def invalidate(self):
+        """Drop the cached copy so the next load() re-reads the files."""
+        with _LOCK:
+            self._cache = None
+            self._key = None
+            self._log_pos = None
+            self._counts = None
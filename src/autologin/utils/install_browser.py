@@ -4,15 +4,44 @@ Ensures Chromium is installed on first run.
 Handles both development and packaged (Briefcase) environments.
 """
 
+import functools
+import importlib.metadata
 import logging
 import os
 import platform
 import shutil
 import subprocess
 import sys
+import threading
+from collections import deque
 from pathlib import Path
 
+# Where Playwright puts the Chromium executables, relative to the browsers path
+_CHROMIUM_EXECUTABLES = (
+    "chromium-*/chrome-*/chrome",
+    "chromium-*/chrome-*/chrome.exe",
+    "chromium-*/chrome-*/Chromium.app/Contents/MacOS/Chromium",
+    "chromium-*/chrome-*/Google Chrome for Testing.app/Contents/MacOS/Google Chrome for Testing",
+    "chromium_headless_shell-*/chrome-*/headless_shell",
+)
 
+# Common user script directories for playwright.exe on Windows
+_WIN_CLI_CANDIDATES = tuple(
+    os.path.join(os.path.expanduser("~"), "AppData", base, "Python", version, "Scripts", "playwright.exe")
+    for base, version in (
+        (os.path.join("Local", "Programs"), "Python311"),
+        (os.path.join("Local", "Programs"), "Python310"),
+        ("Roaming", "Python311"),
+        ("Roaming", "Python310"),
+    )
+)
+
+# Chromium executable found by the last successful is_browser_installed(),
+# so later checks can stat it instead of starting Playwright again
+_browser_path = None
+
+
+@functools.lru_cache(maxsize=1)
 def get_playwright_browsers_path() -> Path:
     """
     Get the path where Playwright browsers should be installed.
@@ -22,10 +51,76 @@ def get_playwright_browsers_path() -> Path:
     return Path(user_data_dir(appname="AutoLogin")) / "playwright-browsers"
 
 
+@functools.lru_cache(maxsize=1)
+def _installed_marker():
+    """
+    Path of the file recording where Chromium was installed for this
+    Playwright version, or None if Playwright's version is unknown.
+    """
+    try:
+        playwright_version = importlib.metadata.version("playwright")
+    except importlib.metadata.PackageNotFoundError:
+        return None
+    return get_playwright_browsers_path() / f".installed-{playwright_version}"
+
+
+def _revision(executable: Path) -> int:
+    """Revision number of the chromium-<rev> directory holding executable."""
+    rev = executable.relative_to(get_playwright_browsers_path()).parts[0].rpartition("-")[2]
+    return int(rev) if rev.isdigit() else -1
+
+
+def _mark_installed(executable_path=None):
+    """
+    Record executable_path in the marker; without one, use the Chromium
+    executable of the highest revision in the browsers path.
+    """
+    marker = _installed_marker()
+    if not marker:
+        return
+    if executable_path is None:
+        browsers_path = get_playwright_browsers_path()
+        found = [p for pattern in _CHROMIUM_EXECUTABLES for p in browsers_path.glob(pattern)]
+        if not found:
+            # Leave it to the next is_browser_installed() probe
+            return
+        executable_path = str(max(found, key=_revision))
+    try:
+        marker.write_text(executable_path, encoding="utf-8")
+    except OSError as e:
+        logging.debug(f"Could not write {marker}: {e}")
+
+
 def is_browser_installed() -> bool:
     """
     Check if Playwright Chromium browser is installed.
     """
+    global _browser_path
+    if _browser_path and os.path.exists(_browser_path):
+        return True
+    
+    # Written after a successful probe or install with the executable's
+    # path; only trusted while that executable is still there, so a
+    # removed or half-deleted Chromium falls through to the probe
+    marker = _installed_marker()
+    if marker:
+        try:
+            recorded = marker.read_text(encoding="utf-8").strip()
+        except OSError:
+            recorded = ""
+        if recorded and os.path.exists(recorded):
+            _browser_path = recorded
+            return True
+    
+    return _probe_browser()
+
+
+def _probe_browser() -> bool:
+    """
+    Ask Playwright for its Chromium executable and, if it exists, remember
+    it in _browser_path and the marker.
+    """
+    global _browser_path
     try:
         # Set environment variable to use our custom browser path
         browsers_path = get_playwright_browsers_path()
@@ -37,6 +132,8 @@ def is_browser_installed() -> bool:
             path = p.chromium.executable_path
             if path and Path(path).exists():
                 logging.info(f"Browser found at: {path}")
+                _browser_path = path
+                _mark_installed(path)
                 return True
             return False
     except Exception as e:
@@ -44,6 +141,55 @@ def is_browser_installed() -> bool:
         return False
 
 
+def _run_streaming(cmd, env, report, timeout=600, creationflags=0):
+    """
+    Run cmd, passing each line of its combined stdout/stderr to report()
+    as it is printed.
+    
+    Returns:
+        (return code, last lines of output)
+    Raises:
+        subprocess.TimeoutExpired: the process ran longer than timeout seconds
+    """
+    proc = subprocess.Popen(
+        cmd,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,
+        creationflags=creationflags
+    )
+    timed_out = threading.Event()
+    
+    def kill():
+        timed_out.set()
+        proc.kill()
+    
+    timer = threading.Timer(timeout, kill)
+    timer.start()
+    tail = deque(maxlen=50)
+    try:
+        with proc.stdout:
+            for line in proc.stdout:
+                line = line.rstrip()
+                # Progress bars redraw the same line many times
+                if line and (not tail or line != tail[-1]):
+                    tail.append(line)
+                    report(line)
+        returncode = proc.wait()
+    finally:
+        timer.cancel()
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+    
+    output = "\n".join(tail)
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(cmd, timeout, output=output)
+    return returncode, output
+
+
 def find_playwright_cli() -> list:
     """
     Find the best way to run playwright CLI.
@@ -59,17 +205,9 @@ def find_playwright_cli() -> list:
     
     # Method 3: On Windows, check common locations
     if platform.system() == "Windows":
-        # Check user scripts directory
-        user_base = os.path.expanduser("~")
-        possible_paths = [
-            Path(user_base) / "AppData" / "Local" / "Programs" / "Python" / "Python311" / "Scripts" / "playwright.exe",
-            Path(user_base) / "AppData" / "Local" / "Programs" / "Python" / "Python310" / "Scripts" / "playwright.exe",
-            Path(user_base) / "AppData" / "Roaming" / "Python" / "Python311" / "Scripts" / "playwright.exe",
-            Path(user_base) / "AppData" / "Roaming" / "Python" / "Python310" / "Scripts" / "playwright.exe",
-        ]
-        for p in possible_paths:
-            if p.exists():
-                return [str(p)]
+        for p in _WIN_CLI_CANDIDATES:
+            if os.path.isfile(p):
+                return [p]
     
     # Method 4: Use python -m playwright (fallback)
     # WARNING: Do NOT use this if running as a packaged app (sys.executable is the app itself)
@@ -149,23 +287,17 @@ def install_browser_via_python_api(progress_callback=None) -> bool:
             
         cmd.extend(["install", "chromium"])
 
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            env=env,
-            timeout=600
-        )
+        # Stream the installer's output so the user sees download progress
+        returncode, output = _run_streaming(cmd, env, report)
         
-        if result.returncode == 0:
+        if returncode == 0:
             report("Browser installation completed successfully!")
             
-            # Verify and fix permissions
+            # Verify and fix permissions. The executables sit at fixed places
+            # under browsers_path, so there's no need to start Playwright again.
             try:
-                from playwright.sync_api import sync_playwright
-                with sync_playwright() as p:
-                    exe_path = p.chromium.executable_path
-                    if exe_path and os.path.exists(exe_path):
+                for pattern in _CHROMIUM_EXECUTABLES:
+                    for exe_path in browsers_path.glob(pattern):
                         report(f"Verifying permissions for: {exe_path}")
                         # Ensure executable has +x perms
                         st = os.stat(exe_path)
@@ -175,7 +307,7 @@ def install_browser_via_python_api(progress_callback=None) -> bool:
                 
             return True
         else:
-            logging.warning(f"Driver install failed: {result.stderr}")
+            logging.warning(f"Driver install failed: {output}")
             return False
 
 
@@ -193,45 +325,72 @@ def install_browser_via_python_api(progress_callback=None) -> bool:
         return False
 
 
+def _find_file(root: Path, name: str, max_depth: int):
+    """Breadth-first search for a file called name at most max_depth levels below root."""
+    level = [str(root)]
+    for _ in range(max_depth + 1):
+        next_level = []
+        for directory in level:
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.name == name and entry.is_file():
+                            return entry.path
+                        if entry.is_dir(follow_symlinks=False):
+                            next_level.append(entry.path)
+            except OSError:
+                continue
+        level = next_level
+    return None
+
+
 def find_manual_driver():
     """Search for the playwright node driver in common locations."""
     node_name = "node.exe" if sys.platform == "win32" else "node"
     
+    # Known layouts first; a full tree walk of a packaged app is slow
+    roots = []
+    candidates = []
+    
     # 1. Search in playwright package location
     try:
         import playwright
         package_root = Path(playwright.__file__).parent
         
-        # Standard location: driver/package/node_modules/playwright-core/.local-browsers/
         # Standard location: driver/node
         driver_dir = package_root / "driver"
-        possible_path = driver_dir / node_name
-        if possible_path.exists():
-            return str(possible_path)
-            
-        # Recursive search in package
-        for path in package_root.rglob(node_name):
-            return str(path)
-            
+        candidates += [
+            driver_dir / node_name,
+            driver_dir / "package" / node_name,
+            driver_dir / "package" / "bin" / node_name,
+        ]
+        roots.append(package_root)
     except ImportError:
         pass
         
     # 2. Search in sys.executable directory (sometimes bundled there)
-    try:
-        base_dir = Path(sys.executable).parent
-        possible_path = base_dir / node_name
-        if possible_path.exists():
-            return str(possible_path)
-            
-        # Recursive search in app dir
-        for path in base_dir.rglob(node_name):
+    base_dir = Path(sys.executable).parent
+    candidates += [
+        base_dir / node_name,
+        base_dir / "app_packages" / "playwright" / "driver" / node_name,
+        base_dir.parent / "app_packages" / "playwright" / "driver" / node_name,
+    ]
+    roots.append(base_dir)
+    
+    for path in candidates:
+        if path.is_file():
             return str(path)
-    except Exception:
-        pass
+    
+    # 3. Last resort: a depth-limited search of the same directories
+    for root in roots:
+        found = _find_file(root, node_name, max_depth=4)
+        if found:
+            return found
         
     return None
 
 
+@functools.lru_cache(maxsize=1)
 def is_packaged_app() -> bool:
     """Check if running as a packaged/frozen application."""
     if getattr(sys, 'frozen', False):
@@ -271,23 +430,20 @@ def install_browser_via_cli(progress_callback=None) -> bool:
     report(f"Running: {' '.join(cmd)}")
     
     try:
-        result = subprocess.run(
+        returncode, output = _run_streaming(
             cmd,
-            capture_output=True,
-            text=True,
-            env=env,
-            timeout=600,
+            env,
+            report,
             # On Windows, hide the console window
             creationflags=subprocess.CREATE_NO_WINDOW if platform.system() == "Windows" else 0
         )
         
-        if result.returncode == 0:
+        if returncode == 0:
             report("Browser installation completed successfully!")
             return True
         else:
-            report(f"Browser installation failed: {result.stderr}")
-            logging.error(f"Playwright install stderr: {result.stderr}")
-            logging.error(f"Playwright install stdout: {result.stdout}")
+            report(f"Browser installation failed (exit code {returncode})")
+            logging.error(f"Playwright install output: {output}")
             return False
             
     except subprocess.TimeoutExpired:
@@ -299,6 +455,16 @@ def install_browser_via_cli(progress_callback=None) -> bool:
         return False
 
 
+def _record_install():
+    """
+    Record the freshly installed Chromium. Older chromium-<rev> directories
+    may still be there, so ask Playwright which one it uses, falling back
+    to the highest revision if it can't be started.
+    """
+    if not _probe_browser():
+        _mark_installed()
+
+
 def install_browser(progress_callback=None) -> bool:
     """
     Install Playwright Chromium browser.
@@ -315,7 +481,10 @@ def install_browser(progress_callback=None) -> bool:
         if progress_callback:
             progress_callback(msg)
     
+    global _browser_path
     report("Starting Playwright browser download...")
+    # A fresh install may put Chromium somewhere new
+    _browser_path = None
     
     # Ensure browsers path exists
     browsers_path = get_playwright_browsers_path()
@@ -325,11 +494,13 @@ def install_browser(progress_callback=None) -> bool:
     # Method 1: Try using Playwright's internal driver (most reliable for packaged apps)
     report("Trying installation method 1 (internal driver)...")
     if install_browser_via_python_api(progress_callback):
+        _record_install()
         return True
     
     # Method 2: Try CLI-based installation
     report("Trying installation method 2 (CLI)...")
     if install_browser_via_cli(progress_callback):
+        _record_install()
         return True
     
     # All methods failed
@@ -366,16 +537,25 @@ class BrowserInstaller:
     Use this when installing from a Qt GUI.
     """
     
+    # Shared by all instances: installs write to the same browsers path
+    _lock = threading.Lock()
+    
     def __init__(self):
         self._installed = None
         
     def check_and_install(self, progress_callback=None) -> bool:
         """Check if browser is installed, install if needed."""
-        if self._installed is None:
-            self._installed = is_browser_installed()
-            
         if self._installed:
             return True
-            
-        self._installed = install_browser(progress_callback)
-        return self._installed
+        
+        # A second caller waits here for the first check/install, then
+        # sees its result instead of starting another one
+        with self._lock:
+            if self._installed is None:
+                self._installed = is_browser_installed()
+                
+            if self._installed:
+                return True
+                
+            self._installed = install_browser(progress_callback)
+            return self._installed
@@ -1,53 +1,94 @@
 from PyQt5.QtCore import QAbstractTableModel, Qt
 
 
-class pandasModel(QAbstractTableModel):
-    def __init__(self, data, editable=False):
+class AccountsModel(QAbstractTableModel):
+    """Read-only table model over a list of row dicts (no pandas needed)."""
+
+    def __init__(self, rows=None, columns=None):
         QAbstractTableModel.__init__(self)
-        self._data = data
-        self.editable = editable
+        self._rows = rows or []
+        self._columns = columns or []
+        self._cells = self._render(self._rows, self._columns)
+
+    @staticmethod
+    def _render(rows, columns):
+        # data() runs for every visible cell on every repaint (and for every
+        # comparison while the proxy sorts), so format each cell only once
+        return [
+            tuple("" if row.get(col) is None else str(row.get(col)) for col in columns)
+            for row in rows
+        ]
+
+    def set_rows(self, rows, columns):
+        """Replace the rows/columns and reset attached views."""
+        self.beginResetModel()
+        self._rows = rows
+        self._columns = columns
+        self._cells = self._render(rows, columns)
+        self.endResetModel()
+
+    def update_rows(self, rows, columns):
+        """
+        Swap in rows of the same shape, signalling only the cells that
+        changed so views keep their selection and scroll position.
+        Returns False (changing nothing) if the shape differs; use
+        set_rows() then.
+        """
+        if columns != self._columns or len(rows) != len(self._rows):
+            return False
+        cells = self._render(rows, columns)
+        old_cells = self._cells
+        self._rows = rows
+        self._cells = cells
+
+        changed = [r for r, (new, old) in enumerate(zip(cells, old_cells)) if new != old]
+        if len(changed) > len(cells) // 4:
+            # Many rows changed: one signal for the whole table
+            self.dataChanged.emit(self.index(0, 0), self.index(
+                len(cells) - 1, len(columns) - 1))
+            return True
+        # One signal per run of adjacent changed cells in each row
+        for r in changed:
+            start = None
+            for c, (new, old) in enumerate(zip(cells[r], old_cells[r])):
+                if new != old:
+                    if start is None:
+                        start = c
+                elif start is not None:
+                    self.dataChanged.emit(self.index(r, start), self.index(r, c - 1))
+                    start = None
+            if start is not None:
+                self.dataChanged.emit(self.index(r, start), self.index(r, len(columns) - 1))
+        return True
+
+    def row(self, row):
+        """Return the dict backing the given row."""
+        return self._rows[row]
+
+    def rows(self):
+        """Return the row dicts, in source order."""
+        return self._rows
+
+    def columns(self):
+        """Return the column names."""
+        return self._columns
 
     def rowCount(self, parent=None):
-        return self._data.shape[0]
+        return len(self._rows)
 
-    def columnCount(self, parnet=None):
-        return self._data.shape[1]
+    def columnCount(self, parent=None):
+        return len(self._columns)
 
     def data(self, index, role=Qt.DisplayRole):
         if index.isValid():
             if role == Qt.DisplayRole:
-                return str(self._data.iloc[index.row(), index.column()])
+                return self._cells[index.row()][index.column()]
             elif role == Qt.TextAlignmentRole:
                 return Qt.AlignCenter
 
-
-    def setData(self, index, value, role):
-        if role == Qt.EditRole:
-            self._data.iloc[index.row(), index.column()] = value
-            return True
-        return False
-
     def headerData(self, col, orientation, role):
         if orientation == Qt.Horizontal and role == Qt.DisplayRole:
-            return self._data.columns[col]
+            return self._columns[col]
 
     def flags(self, index):
-        if self.editable:
-            return Qt.ItemIsEditable | Qt.ItemIsEnabled | Qt.ItemIsSelectable
-        else:
-            return Qt.ItemIsEnabled | Qt.ItemIsSelectable
-
-    def sort(self, col, order):
-        """sort table by given column number col"""
-        self.layoutAboutToBeChanged.emit()
-        self._data = self._data.sort_values(
-            self._data.columns[col], ascending=order == Qt.AscendingOrder)
-        self.layoutChanged.emit()
-
-    def updateData(self, listt):
-        for row in range(self.rowCount()):
-            for col in range(self.columnCount()):
-                if self._data.iloc[row, col] != listt.iloc[row, col]:
-                    self._data.iloc[row, col] = listt.iloc[row, col]
-                    self.dataChanged.emit(self.index(
-                        row, col), self.index(row, col))
\ No newline at end of file
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
@@ -0,0 +1,35 @@
+"""
+Cached .ui and image loading.
+Each .ui file is parsed and compiled once; later dialogs reuse the form class.
+"""
+
+import functools
+import os
+
+from PyQt5 import uic
+from PyQt5.QtGui import QPixmap
+
+
+@functools.lru_cache(maxsize=None)
+def load_ui_type(ui_path):
+    """Return the compiled form class for a .ui file, parsing it only once."""
+    form_class, _ = uic.loadUiType(ui_path)
+    return form_class
+
+
+def load_ui(ui_path, widget):
+    """
+    Drop-in for uic.loadUi(ui_path, widget) backed by the cached form class.
+    Child widgets are exposed as attributes of widget, just like loadUi.
+    """
+    # Normalize so "dialogs/../ui/x.ui" and "ui/x.ui" share one cache entry
+    form = load_ui_type(os.path.normpath(ui_path))()
+    form.setupUi(widget)
+    widget.__dict__.update(form.__dict__)
+    return widget
+
+
+@functools.lru_cache(maxsize=None)
+def load_pixmap(image_path):
+    """Return a QPixmap for image_path, decoding each file only once."""
+    return QPixmap(image_path)
@@ -3,19 +3,33 @@ Auto-updater module for AutoLogin application.
 Checks GitHub Releases for updates and handles download/installation.
 """
 
+import functools
+import hashlib
 import json
 import logging
 import os
 import platform
+import re
 import shutil
 import subprocess
 import sys
 import tempfile
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Optional, Tuple, Callable
 
 import requests
+from platformdirs import user_cache_dir, user_data_dir
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+# Prefer orjson for speed, but fall back to stdlib json if missing
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 # Try to import packaging, but define fallback if missing
 try:
     from packaging import version
@@ -23,6 +37,10 @@ try:
 except ImportError:
     HAS_PACKAGING = False
 
+if HAS_PACKAGING:
+    # The same few version strings are compared on every check
+    _parse_version = functools.lru_cache(maxsize=32)(version.parse)
+
 logger = logging.getLogger(__name__)
 
 # Configuration
@@ -32,7 +50,92 @@ GITHUB_API_URL = f"https://api.github.com/repos/{GITHUB_REPO}/releases/latest"
 # Hardcoded version as fallback (updated during build)
 APP_VERSION = "1.0.23"
 
+# How long a successful update check result is reused (seconds)
+UPDATE_CHECK_TTL = 6 * 60 * 60
+
+# Raw release JSON from the GitHub API, reused for RELEASE_CACHE_TTL seconds.
+# It picks the installer URL and its SHA-256, so it lives in the user's own
+# data dir (next to .update_check.json) rather than a shared temp dir
+RELEASE_CACHE_FILE = Path(user_data_dir(appname="AutoLogin")) / "data" / ".release_cache.json"
+RELEASE_CACHE_TTL = 60 * 60
+
+# Installers are downloaded (and may be resumed or reused) here. It must be
+# private to the user: whatever ends up in it gets launched by apply_update()
+DOWNLOAD_DIR = Path(user_cache_dir(appname="AutoLogin")) / "updates"
+
+# Unix time at which GitHub's API rate limit resets, once it has run out
+_rate_limit_reset = 0.0
+
+# Update downloads: read size, and the parallel ranged download used for
+# files of at least PARALLEL_DOWNLOAD_MIN bytes
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
+DOWNLOAD_BUFFER_SIZE = 1024 * 1024
+PARALLEL_DOWNLOAD_MIN = 8 * 1024 * 1024
+DOWNLOAD_PART_SIZE = 8 * 1024 * 1024
+DOWNLOAD_WORKERS = 4
+
+# download_update() reports progress at most this often (seconds)
+PROGRESS_INTERVAL = 0.1
+
+
+def _dumps(obj) -> bytes:
+    if HAS_ORJSON:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(raw: bytes):
+    if HAS_ORJSON:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _private_dir(path: Path) -> Path:
+    """Create path if needed and make sure only the current user can use it."""
+    path.mkdir(mode=0o700, parents=True, exist_ok=True)
+    # mkdir() leaves the mode of an existing directory alone
+    os.chmod(path, 0o700)
+    return path
+
+
+def _write_private(path: Path, payload: bytes):
+    """Atomically replace path with payload, readable and writable by the user only."""
+    path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    # mkstemp() creates the file with mode 0600
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".release-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _make_session() -> requests.Session:
+    """
+    Session shared by every request in this module, so the update check and
+    the download reuse keep-alive connections; transient errors are retried.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=DOWNLOAD_WORKERS,
+        max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504]),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"User-Agent": f"autologin/{APP_VERSION}"})
+    return session
+
+
+_SESSION = _make_session()
+
 
+@functools.lru_cache(maxsize=1)
 def get_current_version() -> str:
     """Get the current application version."""
     try:
@@ -46,6 +149,10 @@ def get_current_version() -> str:
     return APP_VERSION
 
 
+_NON_DIGITS = re.compile(r"\D+")
+
+
+@functools.lru_cache(maxsize=32)
 def parse_version_fallback(v_str: str) -> tuple:
     """
     Parse version string to tuple of integers for comparison.
@@ -54,14 +161,9 @@ def parse_version_fallback(v_str: str) -> tuple:
     try:
         # Strip leading v
         v_str = v_str.lstrip('v').strip()
-        # Split by dot and convert to int (ignoring non-numeric parts like -beta)
-        parts = []
-        for part in v_str.split('.'):
-            # Extract numeric part
-            num = ''.join(c for c in part if c.isdigit())
-            if num:
-                parts.append(int(num))
-        return tuple(parts)
+        # Split by dot and keep the digits of each part (ignoring non-numeric parts like -beta)
+        nums = (_NON_DIGITS.sub("", part) for part in v_str.split('.'))
+        return tuple(int(num) for num in nums if num)
     except Exception:
         return (0, 0, 0)
 
@@ -71,9 +173,13 @@ def is_version_newer(latest: str, current: str) -> bool:
     Compare versions using packaging if available, or fallback logic.
     Returns True if latest > current.
     """
+    # The usual answer when polling: already on the latest release
+    if latest.lstrip('v').strip() == current.lstrip('v').strip():
+        return False
+
     if HAS_PACKAGING:
         try:
-            return version.parse(latest) > version.parse(current)
+            return _parse_version(latest) > _parse_version(current)
         except Exception:
             logger.warning("Packaging version comparison failed, using fallback")
     
@@ -85,6 +191,7 @@ def is_version_newer(latest: str, current: str) -> bool:
         return False
 
 
+@functools.lru_cache(maxsize=1)
 def get_platform_info() -> Tuple[str, str]:
     """Get platform system and machine info."""
     system = platform.system().lower()
@@ -92,6 +199,7 @@ def get_platform_info() -> Tuple[str, str]:
     return system, machine
 
 
+@functools.lru_cache(maxsize=1)
 def get_platform_asset_suffix() -> str:
     """Get the expected asset file extension for the current platform."""
     system, _ = get_platform_info()
@@ -105,63 +213,144 @@ def get_platform_asset_suffix() -> str:
     return ""
 
 
+def _asset_pattern() -> Optional[re.Pattern]:
+    """
+    Return a regex matching release asset names for this platform, or None
+    if there's no installer for it. Equivalent to the extension check plus
+    the per-platform name checks, in a single search per asset.
+    """
+    system, machine = get_platform_info()
+    if system == "darwin":
+        return re.compile(r"\.dmg$", re.IGNORECASE)
+    if system == "windows":
+        return re.compile(r"\.msi$", re.IGNORECASE)
+    if system == "linux":
+        if "arm" in machine or "aarch64" in machine:
+            return re.compile(r"(arm|aarch64).*\.appimage$", re.IGNORECASE)
+        # x86_64 - exclude arm builds
+        return re.compile(r"^(?!.*(arm|aarch64)).*\.appimage$", re.IGNORECASE)
+    return None
+
+
+# Chosen once: the platform doesn't change while the app runs
+_ASSET_RE = _asset_pattern()
+
+
 def find_platform_asset(assets: list) -> Optional[dict]:
     """
     Find the correct asset for the current platform from the release assets.
     """
-    system, machine = get_platform_info()
-    suffix = get_platform_asset_suffix()
-    
-    if not suffix:
+    if _ASSET_RE is None:
         return None
+    matches = (a for a in assets if _ASSET_RE.search(a.get("name", "")))
+    first = next(matches, None)
+    second = next(matches, None)
+    if second is None:
+        return first
+    matching_assets = [first, second, *matches]
     
-    # Find assets matching our platform
-    matching_assets = []
-    
-    for asset in assets:
-        name = asset.get("name", "").lower()
-        
-        # Must have correct extension
-        if not name.endswith(suffix.lower()):
-            continue
-        
-        # Platform-specific checks
-        if system == "darwin":
-            if "macos" in name or "darwin" in name or name.endswith(".dmg"):
-                matching_assets.append(asset)
-        elif system == "windows":
-            if "windows" in name or "win" in name or name.endswith(".msi"):
-                matching_assets.append(asset)
-        elif system == "linux":
-            if "linux" in name or "appimage" in name.lower():
-                # Check architecture
-                if "arm" in machine or "aarch64" in machine:
-                    if "arm" in name or "aarch64" in name:
-                        matching_assets.append(asset)
-                else:
-                    # x86_64 - exclude arm builds
-                    if "arm" not in name and "aarch64" not in name:
-                        matching_assets.append(asset)
+    # Several candidates: prefer the first one that is actually downloadable,
+    # probing them all at once rather than one round trip after another
+    def reachable(asset):
+        try:
+            url = asset.get("browser_download_url")
+            return bool(url) and _SESSION.head(url, allow_redirects=True, timeout=5).ok
+        except requests.RequestException:
+            return False
     
-    # Return first matching asset
-    return matching_assets[0] if matching_assets else None
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        for asset, ok in zip(matching_assets, pool.map(reachable, matching_assets)):
+            if ok:
+                return asset
+    return matching_assets[0]
+
+
+def _note_rate_limit(response: requests.Response):
+    """Remember when to ask again if the response used up the API rate limit."""
+    global _rate_limit_reset
+    if response.headers.get("X-RateLimit-Remaining") == "0":
+        try:
+            _rate_limit_reset = float(response.headers["X-RateLimit-Reset"])
+        except (KeyError, ValueError):
+            return
+        logger.warning(f"GitHub API rate limit reached until {time.ctime(_rate_limit_reset)}")
+
+
+def _fetch_release_data(force_refresh: bool = False) -> dict:
+    """
+    Return the latest release JSON, from RELEASE_CACHE_FILE if it is younger
+    than RELEASE_CACHE_TTL (and force_refresh is False), otherwise from GitHub.
+    A stale cache is revalidated with its ETag / Last-Modified, so an
+    unchanged release costs a bodyless 304 that GitHub doesn't rate limit.
+    """
+    cached = None
+    try:
+        age = time.time() - RELEASE_CACHE_FILE.stat().st_mtime
+        cached = _loads(RELEASE_CACHE_FILE.read_bytes())
+        release_data = cached["release"]
+        if not force_refresh and age < RELEASE_CACHE_TTL:
+            return release_data
+    except (OSError, ValueError, KeyError, TypeError):
+        cached = None
+
+    if time.time() < _rate_limit_reset:
+        # Asking now would only get a 403: make do with what we have
+        if cached:
+            return cached["release"]
+        raise requests.RequestException("GitHub API rate limit reached, try again later")
+
+    headers = {"Accept": "application/vnd.github.v3+json"}
+    # Optional token for the 5000/hour authenticated limit instead of
+    # 60/hour per IP, which a shared office or carrier NAT can exhaust
+    token = os.environ.get("AUTOLOGIN_GITHUB_TOKEN") or os.environ.get("GITHUB_TOKEN")
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+        headers["X-GitHub-Api-Version"] = "2022-11-28"
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+    response = _SESSION.get(GITHUB_API_URL, headers=headers, timeout=15)
+    _note_rate_limit(response)
+
+    if response.status_code in (403, 429) and cached and time.time() < _rate_limit_reset:
+        return cached["release"]
+
+    if response.status_code == 304 and cached:
+        # Unchanged: restart the TTL without rewriting the file
+        try:
+            os.utime(RELEASE_CACHE_FILE)
+        except OSError:
+            pass
+        return cached["release"]
+
+    response.raise_for_status()
+    release_data = _loads(response.content)
+
+    try:
+        _write_private(RELEASE_CACHE_FILE, _dumps({
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "release": release_data,
+        }))
+    except OSError as e:
+        logger.warning(f"Could not save release cache: {e}")
+    return release_data
 
 
-def check_for_updates() -> Tuple[bool, Optional[str], Optional[str], Optional[str]]:
+def check_for_updates(force_refresh: bool = False) -> Tuple[bool, Optional[str], Optional[str], Optional[str]]:
     """
     Check GitHub for the latest release.
+    The release JSON is cached on disk; force_refresh skips that cache,
+    e.g. for an explicit "Check for Updates" from the user.
     """
     try:
         logger.info("Checking for updates...")
         
-        headers = {"Accept": "application/vnd.github.v3+json"}
-        response = requests.get(GITHUB_API_URL, headers=headers, timeout=15)
-        response.raise_for_status()
-        
-        release_data = response.json()
+        release_data = _fetch_release_data(force_refresh)
         tag_name = release_data.get("tag_name", "")
         latest_version = tag_name.lstrip("v")
-        release_notes = release_data.get("body", "")
         
         current = get_current_version()
         
@@ -171,9 +360,11 @@ def check_for_updates() -> Tuple[bool, Optional[str], Optional[str], Optional[st
             logger.warning("Could not determine latest version from release")
             return False, None, None, None
         
-        # Compare versions
+        # Compare versions first: the assets and release notes are only
+        # looked at when there is something to install
         if is_version_newer(latest_version, current):
             logger.info("Update available!")
+            release_notes = release_data.get("body", "")
             
             # Find the appropriate asset for this platform
             asset = find_platform_asset(release_data.get("assets", []))
@@ -197,54 +388,140 @@ def check_for_updates() -> Tuple[bool, Optional[str], Optional[str], Optional[st
         return False, None, None, str(e)
 
 
+def load_cached_check(cache_file: Path, max_age: float = UPDATE_CHECK_TTL):
+    """
+    Return a check_for_updates()-style result saved by save_cached_check(),
+    or None if there is no cache or it is older than max_age seconds.
+    """
+    try:
+        cached = _loads(Path(cache_file).read_bytes())
+        if time.time() - cached["checked_at"] >= max_age:
+            return None
+        latest_version = cached["latest_version"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+    # Compare again: the app may have been updated since the check
+    if is_version_newer(latest_version, get_current_version()):
+        return True, latest_version, cached.get("url"), cached.get("notes") or ""
+    return False, latest_version, None, None
+
+
+def save_cached_check(cache_file: Path, result: tuple):
+    """Save a check_for_updates() result for load_cached_check()."""
+    has_update, latest_version, url, notes = result
+    if not latest_version:
+        # Failed checks aren't cached so the next one retries
+        return
+    try:
+        Path(cache_file).write_bytes(_dumps({
+            "checked_at": time.time(),
+            "latest_version": latest_version,
+            "url": url,
+            "notes": notes if has_update else None,
+        }))
+    except OSError as e:
+        logger.warning(f"Could not save update check cache: {e}")
+
+
+class _RangeNotSupported(Exception):
+    """The server answered a Range request with the whole file."""
+
+
 def download_update(
     download_url: str,
-    progress_callback: Optional[Callable[[int, int], None]] = None
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    is_cancelled: Optional[Callable[[], bool]] = None
 ) -> Optional[Path]:
     """
-    Download the update file.
+    Download the update file, streaming it straight to disk.
+    Large files on servers that accept byte ranges are fetched over
+    several connections at once.
+    
+    Data is written to "<file>.part" and only renamed once complete. If a
+    download is cancelled or fails, calling this again with the same URL
+    resumes from what is already on disk; a finished file that matches the
+    release's published SHA-256 is returned without downloading anything.
     
     Args:
         download_url: URL to download from
-        progress_callback: Optional callback(downloaded_bytes, total_bytes)
+        progress_callback: Optional callback(downloaded_bytes, total_bytes),
+            called at most every PROGRESS_INTERVAL seconds plus once when the
+            last byte arrives. It runs on the downloading thread (or one of
+            the range threads), so it must not touch widgets directly: hand
+            the values to the GUI thread, e.g. through a queued Qt signal
+        is_cancelled: Optional callback checked between chunks; returning
+            True stops the download, keeping the partial file for a resume
     
     Returns:
-        Path to downloaded file, or None on failure
+        Path to downloaded file, or None on failure or cancellation
     """
     try:
         logger.info(f"Downloading update from: {download_url}")
         
-        response = requests.get(download_url, stream=True, timeout=300)
-        response.raise_for_status()
-        
-        total_size = int(response.headers.get("content-length", 0))
-        
         # Create temp file with appropriate extension
         suffix = Path(download_url).suffix or ".zip"
         # Ensure the suffix is valid
         if suffix not in [".msi", ".dmg", ".AppImage", ".zip", ".exe", ".deb"]:
             suffix = ".zip"
         
-        # Use a proper download directory
-        download_dir = Path(tempfile.gettempdir()) / "autologin_updates"
-        download_dir.mkdir(parents=True, exist_ok=True)
+        download_dir = _private_dir(DOWNLOAD_DIR)
         
         # Extract filename from URL
         filename = Path(download_url).name
         temp_file = download_dir / filename
-        
-        downloaded = 0
-        chunk_size = 8192
+        part_file = download_dir / (filename + ".part")
+        # Start offsets of the byte ranges already in part_file
+        parts_file = download_dir / (filename + ".parts")
         
         logger.info(f"Downloading to: {temp_file}")
         
-        with open(temp_file, "wb") as f:
-            for chunk in response.iter_content(chunk_size=chunk_size):
-                if chunk:
-                    f.write(chunk)
-                    downloaded += len(chunk)
-                    if progress_callback:
-                        progress_callback(downloaded, total_size)
+        if progress_callback:
+            progress_callback = _throttled(progress_callback)
+        
+        expected_sha256 = _expected_sha256(download_url)
+        total_size, accepts_ranges = _probe_download(download_url)
+        try:
+            # A size match alone doesn't prove the file is the release, so a
+            # leftover is only trusted when there's a published digest to check
+            if (expected_sha256 and total_size and temp_file.stat().st_size == total_size
+                    and _sha256_matches(temp_file, expected_sha256)):
+                # Finished by an earlier run (e.g. the install was declined)
+                logger.info(f"Update already downloaded: {temp_file}")
+                if progress_callback:
+                    progress_callback(total_size, total_size)
+                return temp_file
+        except FileNotFoundError:
+            pass
+        done = False
+        if accepts_ranges and total_size >= PARALLEL_DOWNLOAD_MIN:
+            try:
+                _download_ranges(download_url, part_file, parts_file, total_size, progress_callback, is_cancelled)
+                done = True
+            except _RangeNotSupported:
+                logger.info("Server ignored the Range header, downloading in one stream")
+        if not done:
+            total_size = _download_stream(download_url, part_file, parts_file, progress_callback, is_cancelled)
+        
+        if is_cancelled and is_cancelled():
+            logger.info(f"Download cancelled, keeping {part_file} to resume")
+            return None
+        
+        size = part_file.stat().st_size
+        if total_size and size != total_size:
+            # Don't resume from a file we can't trust
+            part_file.unlink()
+            parts_file.unlink(missing_ok=True)
+            raise IOError(f"Downloaded {size} of {total_size} bytes")
+        if not _sha256_matches(part_file, expected_sha256):
+            part_file.unlink()
+            parts_file.unlink(missing_ok=True)
+            raise IOError("Downloaded file does not match the release's SHA-256")
+        # Make sure the data is on disk before the file gets its final name
+        with open(part_file, "rb+") as f:
+            os.fsync(f.fileno())
+        os.replace(part_file, temp_file)
+        parts_file.unlink(missing_ok=True)
         
         logger.info(f"Download complete: {temp_file}")
         return temp_file
@@ -254,6 +531,218 @@ def download_update(
         return None
 
 
+def _expected_sha256(download_url: str) -> Optional[str]:
+    """
+    Return the SHA-256 GitHub publishes for the release asset at
+    download_url, from the cached release JSON: the asset's "digest" field,
+    or a "<asset name>.sha256" file uploaded next to it. None if neither.
+    """
+    try:
+        assets = _loads(RELEASE_CACHE_FILE.read_bytes())["release"].get("assets", [])
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+    asset = next((a for a in assets if a.get("browser_download_url") == download_url), None)
+    if asset is None:
+        return None
+    
+    digest = asset.get("digest") or ""
+    if digest.startswith("sha256:"):
+        return digest[len("sha256:"):].lower()
+    
+    sidecar_name = asset.get("name", "") + ".sha256"
+    sidecar = next((a for a in assets if a.get("name") == sidecar_name), None)
+    if sidecar is None:
+        return None
+    try:
+        response = _SESSION.get(sidecar["browser_download_url"], timeout=15)
+        response.raise_for_status()
+        # "<hex digest>  <file name>" as written by sha256sum, or just the digest
+        return response.text.split()[0].lower()
+    except (requests.RequestException, KeyError, IndexError) as e:
+        logger.warning(f"Could not fetch {sidecar_name}: {e}")
+        return None
+
+
+def _sha256_matches(path: Path, expected_sha256: Optional[str]) -> bool:
+    """Hash path in one sequential pass; True if it matches, or if there is nothing to check."""
+    if not expected_sha256:
+        return True
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(DOWNLOAD_BUFFER_SIZE), b""):
+            sha256.update(block)
+    if sha256.hexdigest() != expected_sha256:
+        logger.warning(f"SHA-256 mismatch for {path}")
+        return False
+    return True
+
+
+def _throttled(progress_callback):
+    """
+    Wrap progress_callback so it runs at most every PROGRESS_INTERVAL
+    seconds, plus once for the final byte. Safe to call from several threads.
+    """
+    lock = threading.Lock()
+    last_emit = 0.0
+    
+    def report(downloaded, total_size):
+        nonlocal last_emit
+        now = time.monotonic()
+        with lock:
+            if now - last_emit < PROGRESS_INTERVAL and downloaded != total_size:
+                return
+            last_emit = now
+        progress_callback(downloaded, total_size)
+    
+    return report
+
+
+def _probe_download(download_url: str) -> Tuple[int, bool]:
+    """Return (size, accepts byte ranges) from a HEAD request, or (0, False)."""
+    try:
+        response = _SESSION.head(download_url, allow_redirects=True, timeout=30)
+        response.raise_for_status()
+    except requests.RequestException as e:
+        logger.info(f"HEAD request failed, downloading in one stream: {e}")
+        return 0, False
+    total_size = int(response.headers.get("content-length", 0))
+    accepts_ranges = response.headers.get("accept-ranges", "").lower() == "bytes"
+    return total_size, accepts_ranges
+
+
+def _download_stream(download_url, part_file, parts_file, progress_callback, is_cancelled) -> int:
+    """
+    Download download_url into part_file over a single connection,
+    continuing a previous stream if part_file holds its first bytes.
+    Returns the full size of the file, or 0 if the server didn't say.
+    """
+    existing = 0
+    # A .parts file means part_file has holes from a ranged download
+    if part_file.exists() and not parts_file.exists():
+        existing = part_file.stat().st_size
+    parts_file.unlink(missing_ok=True)
+    
+    headers = {"Range": f"bytes={existing}-"} if existing else {}
+    # The timeout applies per connect/read, not to the whole download
+    response = _SESSION.get(download_url, headers=headers, stream=True, timeout=30)
+    if response.status_code == 416:
+        # Nothing past what we have: either part_file is already complete,
+        # or it is left over from a different file and must be discarded
+        response.close()
+        total_size = int(response.headers.get("content-range", "").rpartition("/")[2] or 0)
+        if total_size == existing:
+            return total_size
+        part_file.unlink()
+        return _download_stream(download_url, part_file, parts_file, progress_callback, is_cancelled)
+    response.raise_for_status()
+    
+    if response.status_code == 206:
+        # "Content-Range: bytes start-end/total"
+        total_size = int(response.headers.get("content-range", "").rpartition("/")[2] or 0)
+        downloaded = existing
+        mode = "ab"
+        logger.info(f"Resuming download at {existing} bytes")
+    else:
+        # No Range sent, or the server ignored it: start over
+        total_size = int(response.headers.get("content-length", 0))
+        downloaded = 0
+        mode = "wb"
+    
+    with response, open(part_file, mode, buffering=DOWNLOAD_BUFFER_SIZE) as f:
+        if hasattr(os, "posix_fadvise"):
+            # Written once front to back: let the kernel write back eagerly
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        if progress_callback is None and is_cancelled is None:
+            # Nothing to do between chunks: let shutil run the copy loop
+            response.raw.decode_content = True
+            shutil.copyfileobj(response.raw, f, DOWNLOAD_CHUNK_SIZE)
+            return total_size
+        for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+            if is_cancelled and is_cancelled():
+                break
+            if chunk:
+                f.write(chunk)
+                downloaded += len(chunk)
+                if progress_callback:
+                    progress_callback(downloaded, total_size)
+    return total_size
+
+
+def _download_ranges(download_url, part_file, parts_file, total_size, progress_callback, is_cancelled):
+    """
+    Download download_url into part_file as DOWNLOAD_PART_SIZE byte ranges
+    fetched by DOWNLOAD_WORKERS threads, each writing at its own offset.
+    Finished ranges are recorded in parts_file and skipped on a resume.
+    Raises _RangeNotSupported if the server sends the whole file instead.
+    """
+    lock = threading.Lock()
+    failed = threading.Event()
+    
+    def stopped():
+        return failed.is_set() or bool(is_cancelled and is_cancelled())
+    
+    def fetch(start, end):
+        nonlocal downloaded
+        if stopped():
+            return
+        headers = {"Range": f"bytes={start}-{end}"}
+        with _SESSION.get(download_url, headers=headers, stream=True, timeout=30) as response:
+            response.raise_for_status()
+            if response.status_code != 206:
+                raise _RangeNotSupported()
+            written = 0
+            with open(part_file, "r+b") as f:
+                f.seek(start)
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    if stopped():
+                        return
+                    f.write(chunk)
+                    written += len(chunk)
+                    with lock:
+                        downloaded += len(chunk)
+                        if progress_callback:
+                            progress_callback(downloaded, total_size)
+        if written != end - start + 1:
+            raise IOError(f"Got {written} bytes for range {start}-{end}")
+        with lock:
+            with open(parts_file, "a") as f:
+                f.write(f"{start}\n")
+    
+    ranges = [
+        (start, min(start + DOWNLOAD_PART_SIZE, total_size) - 1)
+        for start in range(0, total_size, DOWNLOAD_PART_SIZE)
+    ]
+    
+    finished = set()
+    try:
+        if part_file.stat().st_size == total_size:
+            finished = {int(line) for line in parts_file.read_text().split()}
+    except (OSError, ValueError):
+        pass
+    if finished:
+        logger.info(f"Resuming download, {len(finished)} of {len(ranges)} parts already done")
+    else:
+        # Size the file up front so every part can be written in place.
+        # The (empty) parts_file marks part_file as having holes.
+        with open(part_file, "wb") as f:
+            f.truncate(total_size)
+        parts_file.write_text("")
+    
+    downloaded = sum(end - start + 1 for start, end in ranges if start in finished)
+    todo = [(start, end) for start, end in ranges if start not in finished]
+    with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as pool:
+        futures = [pool.submit(fetch, start, end) for start, end in todo]
+        try:
+            for future in as_completed(futures):
+                future.result()
+        except BaseException:
+            # Stop the other parts before leaving the pool
+            failed.set()
+            for future in futures:
+                future.cancel()
+            raise
+
+
 def apply_update(update_file: Path) -> bool:
     """
     Apply the downloaded update.
@@ -276,15 +765,29 @@ def apply_update(update_file: Path) -> bool:
         return False
 
 
+def _launch(cmd: list):
+    """
+    Start cmd without waiting for it: the app quits right after, and
+    open/xdg-open can take seconds to bring up Finder or a file manager.
+    """
+    subprocess.Popen(
+        cmd,
+        close_fds=True,
+        start_new_session=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
 def _apply_macos_update(update_file: Path) -> bool:
     """Apply update on macOS."""
     # For .dmg files, open them for user to drag to Applications
     if update_file.suffix == ".dmg":
-        subprocess.run(["open", str(update_file)])
+        _launch(["open", str(update_file)])
         return True
     # For .app.zip files, extract and replace
     elif update_file.suffix == ".zip":
-        subprocess.run(["open", str(update_file)])
+        _launch(["open", str(update_file)])
         return True
     return False
 
@@ -302,8 +805,9 @@ def _apply_windows_update(update_file: Path) -> bool:
             os.startfile(str(update_file))
             return True
         except Exception:
-            # Fallback to subprocess
-            subprocess.Popen([str(update_file)], shell=True)
+            # Fallback to subprocess, without going through cmd.exe
+            cmd = ["msiexec", "/i", str(update_file)] if update_file.suffix == ".msi" else [str(update_file)]
+            subprocess.Popen(cmd, close_fds=True)
             return True
     return False
 
@@ -314,48 +818,109 @@ def _apply_linux_update(update_file: Path) -> bool:
     if "AppImage" in update_file.name or update_file.suffix == ".AppImage":
         # Make executable and open containing directory
         update_file.chmod(0o755)
-        subprocess.run(["xdg-open", str(update_file.parent)])
+        _launch(["xdg-open", str(update_file.parent)])
         return True
     # For .deb files
     elif update_file.suffix == ".deb":
-        subprocess.run(["xdg-open", str(update_file)])
+        _launch(["xdg-open", str(update_file)])
         return True
     return False
 
 
 class UpdateChecker:
-    """Background update checker with callbacks."""
+    """
+    Background update checker with callbacks.
+    Only one check runs at a time across all instances.
+    """
+    
+    # Held while any instance's check is running
+    _inflight = threading.Lock()
     
     def __init__(
         self,
         on_update_available: Optional[Callable[[str, str, str], None]] = None,
         on_no_update: Optional[Callable[[], None]] = None,
         on_error: Optional[Callable[[str], None]] = None,
-        on_checking: Optional[Callable[[], None]] = None
+        on_checking: Optional[Callable[[], None]] = None,
+        cache_file: Optional[Path] = None,
+        max_age: float = UPDATE_CHECK_TTL
     ):
+        """
+        If cache_file is given, a result younger than max_age is reused
+        instead of querying GitHub, and fresh results are written back to it.
+        """
         self.on_update_available = on_update_available
         self.on_no_update = on_no_update
         self.on_error = on_error
         self.on_checking = on_checking
+        self.cache_file = cache_file
+        self.max_age = max_age
         self._thread: Optional[threading.Thread] = None
     
-    def check_async(self):
-        """Check for updates in a background thread."""
+    def check_async(self) -> bool:
+        """
+        Check for updates in a background thread.
+        Returns False (and does nothing) if a check is already running.
+        
+        A fresh cached result is answered right away without starting a
+        thread, so the callbacks may run synchronously on the caller's
+        thread as well as on the worker; either way they must leave any UI
+        work to the GUI thread (e.g. by emitting a Qt signal).
+        """
+        result = self._peek_cache()
+        if result is not None:
+            self._dispatch(result)
+            return True
+        if not UpdateChecker._inflight.acquire(blocking=False):
+            logger.info("Update check already in progress")
+            return False
         if self.on_checking:
             self.on_checking()
         self._thread = threading.Thread(target=self._check_worker, daemon=True)
         self._thread.start()
+        return True
+    
+    def _peek_cache(self):
+        """Return the cached check result if it is still fresh, else None."""
+        if self.cache_file and self.max_age > 0:
+            return load_cached_check(self.cache_file, self.max_age)
+        return None
+    
+    def _dispatch(self, result):
+        """Call the callback matching a check_for_updates()-style result."""
+        has_update, new_version, url, notes = result
+        if has_update:
+            if self.on_update_available:
+                self.on_update_available(new_version, url, notes or "")
+        elif new_version is None:
+            # check_for_updates() reports failures as (False, None, None, error)
+            if self.on_error:
+                self.on_error(notes or "Update check failed")
+        elif self.on_no_update:
+            self.on_no_update()
     
     def _check_worker(self):
         """Worker function for background update check."""
         try:
-            has_update, new_version, url, notes = check_for_updates()
-            
-            if has_update and self.on_update_available:
-                self.on_update_available(new_version, url, notes or "")
-            elif not has_update and self.on_no_update:
-                self.on_no_update()
+            # check_async() already found no fresh cached result
+            result = check_for_updates()
+            if self.cache_file:
+                save_cached_check(self.cache_file, result)
+            self._dispatch(result)
         except Exception as e:
             logger.exception("Update check failed")
             if self.on_error:
                 self.on_error(str(e))
+        finally:
+            UpdateChecker._inflight.release()
+
+
+def check_for_updates_exclusive(force_refresh: bool = False) -> Tuple[bool, Optional[str], Optional[str], Optional[str]]:
+    """
+    check_for_updates() for callers with their own thread (e.g. the manual
+    check's QThread): waits for a running UpdateChecker check instead of
+    querying GitHub alongside it. A forced check that follows one then only
+    costs a conditional request answered with a 304.
+    """
+    with UpdateChecker._inflight:
+        return check_for_updates(force_refresh)
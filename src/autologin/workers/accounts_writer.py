@@ -0,0 +1,34 @@
+"""
+Background writer for accounts.json.
+Keeps file writes and fsyncs off the Qt main thread.
+"""
+
+import logging
+
+from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot
+
+
+class AccountsWriter(QObject):
+    """
+    Flushes an AccountsStore on whichever thread this object lives in.
+
+    Changes made while a flush is queued are picked up by that same
+    flush, so bursts of edits collapse into a single write.
+
+    Signals:
+        failed: Emits the error message if a write fails
+    """
+
+    failed = pyqtSignal(str)
+
+    def __init__(self, store):
+        super().__init__()
+        self.store = store
+
+    @pyqtSlot()
+    def flush(self):
+        try:
+            self.store.flush()
+        except Exception as e:
+            logging.error(f"Failed to write accounts.json: {e}")
+            self.failed.emit(str(e))
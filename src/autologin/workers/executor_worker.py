@@ -4,15 +4,14 @@ Replaces the sequential Selenium-based executor with async concurrent processing
 """
 
 import asyncio
-import json
 import logging
-import os
 import time
 from pathlib import Path
 from typing import Dict, List, Tuple
 
 from PyQt5.QtCore import QThread, pyqtSignal, pyqtSlot
 
+from autologin.utils.accounts_store import AccountsStore
 from autologin.workers.playwright_driver import (
     PlaywrightDriver,
     detect_optimal_concurrency,
@@ -57,7 +56,8 @@ class ExecutorWorker(QThread):
             selected_accounts: Optional list of (broker, client_id) to login specific accounts
         """
         super(ExecutorWorker, self).__init__(parent)
-        self.data_dir = data_dir
+        self.data_dir = Path(data_dir)
+        self.accounts_path = self.data_dir / "accounts.json"
         self.all_login = all_login
         self.is_headless = is_headless
         self.max_concurrent = max_concurrent or detect_optimal_concurrency()
@@ -102,15 +102,11 @@ class ExecutorWorker(QThread):
         """
         Execute all broker logins concurrently with semaphore-based throttling.
         """
-        path = f"{self.data_dir}/accounts.json"
+        store = AccountsStore(self.accounts_path)
         
         # Load accounts
         try:
-            if not os.path.exists(path):
-                with open(path, "w") as f:
-                    json.dump({}, f)
-            with open(path, "r") as f:
-                accounts = json.load(f) or {}
+            accounts = store.load() or {}
         except Exception as e:
             logging.error(f"Error reading accounts.json: {e}")
             accounts = {}
@@ -123,25 +119,25 @@ class ExecutorWorker(QThread):
             return
         
         # Build list of (broker, account) tuples to process
-        login_tasks: List[Tuple[str, dict]] = []
-        
+        all_accounts = [
+            (broker, account)
+            for broker, account_list in accounts.items()
+            for account in account_list
+        ]
+
         if self.selected_accounts:
             # Login only specific accounts
-            target_map = {} # (broker_key, client_id) -> bool
-            for broker_key, client_id in self.selected_accounts:
-                 target_map[(broker_key, client_id)] = True
-            
-            for broker, account_list in accounts.items():
-                for account in account_list:
-                    if (broker, account.get('client_id')) in target_map:
-                        login_tasks.append((broker, account))
+            targets = set(self.selected_accounts)  # {(broker_key, client_id)}
+            login_tasks: List[Tuple[str, dict]] = [
+                (broker, account) for broker, account in all_accounts
+                if (broker, account.get('client_id')) in targets
+            ]
         else:
             # Standard logic (All or Failed only)
-            for broker, account_list in accounts.items():
-                for account in account_list:
-                    if not self.all_login and account.get('status') == "Logged In":
-                        continue
-                    login_tasks.append((broker, account))
+            login_tasks = [
+                (broker, account) for broker, account in all_accounts
+                if self.all_login or account.get('status') != "Logged In"
+            ]
         
         total = len(login_tasks)
         if total == 0:
@@ -226,8 +222,7 @@ class ExecutorWorker(QThread):
         
         # Save updated accounts
         try:
-            with open(path, "w") as f:
-                json.dump(accounts, f)
+            store.save(accounts)
         except Exception as e:
             logging.error(f"Failed to save accounts.json: {e}")
         
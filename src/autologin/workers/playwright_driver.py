@@ -13,6 +13,21 @@ from playwright.async_api import async_playwright, Browser, BrowserContext, Page
 from autologin.workers.stealth import get_stealth_scripts
 
 
+def build_stealth_bundle() -> str:
+    """
+    Join the stealth scripts into a single init script.
+    Each script runs in its own guarded scope so one failure doesn't skip the rest.
+    """
+    return "\n".join(
+        f"try {{ (() => {{ {script} }})(); }} catch (e) {{}}"
+        for script in get_stealth_scripts()
+    )
+
+
+# Built once per process and shared by every context
+STEALTH_BUNDLE = build_stealth_bundle()
+
+
 def get_data_dir():
     """Get the application data directory."""
     return Path(user_data_dir(appname="AutoLogin")) / "data"
@@ -68,6 +83,9 @@ class PlaywrightDriver:
     """
     Manages Playwright browser instances with stealth settings.
     Designed for concurrent execution of multiple login flows.
+
+    A single browser is launched per batch and every login gets its own
+    lightweight context, so the browser launch cost is paid once per run.
     """
     
     def __init__(self, headless: bool = True):
@@ -154,10 +172,8 @@ class PlaywrightDriver:
         return context
     
     async def _apply_stealth(self, context: BrowserContext):
-        # Apply stealth modifications from stealth module
-        scripts = get_stealth_scripts()
-        for script in scripts:
-            await context.add_init_script(script)
+        # Apply stealth modifications from stealth module in one round trip
+        await context.add_init_script(STEALTH_BUNDLE)
 
 
 async def wait_and_fill(page: Page, selector: str, value: str, timeout: int = 10000):
@@ -0,0 +1,37 @@
+"""
+Background worker that prepares the accounts table data.
+Keeps accounts.json reads and row building off the Qt main thread.
+"""
+
+import logging
+
+from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot
+
+
+class RefreshWorker(QObject):
+    """
+    Builds the accounts table rows on a worker thread.
+
+    Signals:
+        ready: Emits (rows, columns) once the table data is built
+    """
+
+    ready = pyqtSignal(object, object)
+
+    def __init__(self, build_rows):
+        """
+        Args:
+            build_rows: Callable returning (rows, columns).
+                Must not touch any widgets, it runs off the main thread.
+        """
+        super().__init__()
+        self.build_rows = build_rows
+
+    @pyqtSlot()
+    def run(self):
+        try:
+            rows, columns = self.build_rows()
+        except Exception as e:
+            logging.error(f"Failed to refresh accounts table: {e}")
+            return
+        self.ready.emit(rows, columns)
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Let "pytest tests" import the app straight from a source checkout
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
@@ -0,0 +1,108 @@
+import json
+
+from autologin.utils import accounts_store
+from autologin.utils.accounts_store import AccountsStore
+
+
+def account(client_id, **extra):
+    return {"client_id": client_id, "password": "p", "status": "Logged Out", **extra}
+
+
+def read_snapshot(store):
+    return json.loads(store.path.read_bytes())
+
+
+def test_put_is_journaled_and_seen_by_a_fresh_instance(tmp_path):
+    store = AccountsStore(tmp_path / "accounts.json")
+    store.save({"zerodha": [account("Z1")]})
+    store.put("zerodha", "Z2", account("Z2"))
+
+    assert store.log_path.exists()
+    assert read_snapshot(store) == {"zerodha": [account("Z1")]}
+    fresh = AccountsStore(tmp_path / "accounts.json")
+    assert fresh.load() == {"zerodha": [account("Z1"), account("Z2")]}
+
+
+def test_put_with_a_new_client_id_renames_the_account(tmp_path):
+    store = AccountsStore(tmp_path / "accounts.json")
+    store.save({"zerodha": [account("OLD"), account("Z2")]})
+    store.put("zerodha", "OLD", account("NEW"))
+
+    fresh = AccountsStore(tmp_path / "accounts.json")
+    assert fresh.load() == {"zerodha": [account("NEW"), account("Z2")]}
+    # Replaying the journal on top of the renamed account changes nothing
+    accounts = fresh.load()
+    fresh._read_journal(accounts, None)
+    assert accounts == {"zerodha": [account("NEW"), account("Z2")]}
+
+
+def test_torn_last_journal_line_is_ignored_and_not_built_on(tmp_path):
+    store = AccountsStore(tmp_path / "accounts.json")
+    store.save({"zerodha": []})
+    store.put("zerodha", "Z1", account("Z1"))
+    store.put("zerodha", "Z2", account("Z2"))
+    # Simulate a crash halfway through writing the second entry
+    raw = store.log_path.read_bytes()
+    store.log_path.write_bytes(raw[:-10])
+
+    fresh = AccountsStore(tmp_path / "accounts.json")
+    assert fresh.load() == {"zerodha": [account("Z1")]}
+
+    # Appending after the torn line would glue the next entry onto it, so
+    # the store rewrites accounts.json and drops the journal instead
+    fresh.put("zerodha", "Z3", account("Z3"))
+    assert not fresh.log_path.exists()
+    assert read_snapshot(fresh) == {"zerodha": [account("Z1"), account("Z3")]}
+    assert AccountsStore(tmp_path / "accounts.json").load() == read_snapshot(fresh)
+
+
+def test_journal_is_compacted_into_accounts_json(tmp_path, monkeypatch):
+    monkeypatch.setattr(accounts_store, "COMPACT_SIZE", 200)
+    store = AccountsStore(tmp_path / "accounts.json")
+    store.save({"zerodha": []})
+
+    expected = []
+    for i in range(5):
+        store.put("zerodha", f"Z{i}", account(f"Z{i}"))
+        expected.append(account(f"Z{i}"))
+    # The journal passed COMPACT_SIZE at some point and was folded in
+    folded = read_snapshot(store)["zerodha"]
+    assert 0 < len(folded) < len(expected)
+    assert folded == expected[:len(folded)]
+    assert store.log_path.stat().st_size < accounts_store.COMPACT_SIZE
+
+    store.compact()
+    assert not store.log_path.exists()
+    assert read_snapshot(store) == {"zerodha": expected}
+    assert AccountsStore(tmp_path / "accounts.json").load() == {"zerodha": expected}
+
+
+def test_save_keeps_entries_journaled_by_another_instance(tmp_path):
+    path = tmp_path / "accounts.json"
+    first = AccountsStore(path)
+    first.save({"zerodha": [account("Z1")], "upstox": []})
+
+    second = AccountsStore(path)
+    accounts = second.load()
+    # Journaled by the first instance after the second one loaded
+    first.put("zerodha", "Z2", account("Z2"))
+
+    accounts["upstox"].append(account("U1"))
+    second.save(accounts)
+
+    assert not path.with_suffix(".log").exists()
+    expected = {"zerodha": [account("Z1"), account("Z2")], "upstox": [account("U1")]}
+    assert read_snapshot(second) == expected
+    assert AccountsStore(path).load() == expected
+    assert first.load() == expected
+
+
+def test_load_returns_a_copy(tmp_path):
+    store = AccountsStore(tmp_path / "accounts.json")
+    store.save({"zerodha": [account("Z1")]})
+
+    accounts = store.load()
+    accounts["zerodha"][0]["status"] = "Logged In"
+    accounts["zerodha"].append(account("Z2"))
+
+    assert store.load() == {"zerodha": [account("Z1")]}